@@ -1,15 +1,68 @@
 """CLIコマンド定義"""
+import calendar
+import io
+import os
+import sys
+import tempfile
 import click
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import date
+from itertools import chain
+from typing import IO, Iterator, Optional
 from decimal import Decimal
-from ..services.notion import NotionService
-from ..services.moneyforward import MoneyForwardService
-from ..mappers.invoice_mapper import InvoiceMapper
 from ..utils.config import config
-from ..utils.auth import MoneyForwardAuth
+from ..utils.rate_limiter import RateLimiter
 from ..utils.exceptions import NotionToMFError, AuthenticationError
 from . import formatters
 
+# 標準出力をUTF-8に設定済みかどうか
+_stdout_configured = False
+
+
+def _ensure_utf8_stdout() -> None:
+    """Windowsで標準出力をUTF-8に設定（プロセス内で1回のみ）"""
+    global _stdout_configured
+    if _stdout_configured:
+        return
+
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    _stdout_configured = True
+
+
+@contextmanager
+def _atomic_output(path: str, mode: str, **open_kwargs) -> Iterator[IO]:
+    """出力先と同じディレクトリの一時ファイルに書き込み、成功時のみ置き換える
+
+    取得しながら書き出す途中でエラーになっても、不完全なファイルを残さない
+
+    Args:
+        path: 出力先ファイルパス
+        mode: ファイルモード（'w' または 'wb'）
+        **open_kwargs: open() に渡す追加の引数
+
+    Yields:
+        書き込み用のファイルオブジェクト
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    try:
+        # mkstemp は 0600 で作成するため、通常の open() と同じパーミッションにする
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+
+        with os.fdopen(fd, mode, **open_kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="notion-to-mf")
@@ -97,18 +150,22 @@ def fetch(
         notion-to-mf fetch --format json --output data.json
         notion-to-mf fetch --limit 10 --format detailed
     """
+    # サービスは実行時に読み込む（--help や version の起動を軽くするため）
+    from ..services.notion import NotionService
+
+    if output_format in ('json', 'csv') and not output:
+        # 標準出力にはデータのみを書き出し、メッセージは標準エラー出力に分ける
+        click.get_current_context().with_resource(formatters.messages_to_stderr())
+
     try:
         # 設定検証
         config.validate()
 
         # 年月フィルタをdate_from/date_toに変換
         if year or month:
-            from datetime import date as date_type
-            import calendar
-
             # 年が指定されていない場合は現在の年
             if not year:
-                year = date_type.today().year
+                year = date.today().year
 
             # 月が指定されている場合は該当月のみ
             if month:
@@ -126,57 +183,58 @@ def fetch(
                 date_to = f"{year:04d}-12-31"
 
         # Notionサービス初期化
-        notion = NotionService()
-
-        # データ取得
-        formatters.print_info("Notionからデータを取得中...")
-        projects = notion.fetch_training_projects(
-            status_filter=status,
-            limit=limit,
-            start_date_from=date_from,
-            start_date_to=date_to,
-            amount_min=amount_min,
-            amount_max=amount_max
-        )
-
-        if not projects:
-            formatters.print_warning("データが見つかりませんでした")
-            return
-
-        # フォーマットに応じて出力
-        if output_format == 'table':
-            formatters.format_table(projects)
-
-        elif output_format == 'detailed':
-            formatters.format_detailed(projects)
-
-        elif output_format == 'json':
-            json_output = formatters.format_json(projects)
-            if output:
-                with open(output, 'w', encoding='utf-8') as f:
-                    f.write(json_output)
-                formatters.print_success(f"JSONファイルを出力しました: {output}")
-            else:
-                # UTF-8 で出力
-                import sys
-                if sys.platform == 'win32':
-                    import io
-                    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-                click.echo(json_output)
-
-        elif output_format == 'csv':
-            csv_output = formatters.format_csv(projects)
-            if output:
-                with open(output, 'w', encoding='utf-8') as f:
-                    f.write(csv_output)
-                formatters.print_success(f"CSVファイルを出力しました: {output}")
-            else:
-                # UTF-8 で出力
-                import sys
-                if sys.platform == 'win32':
-                    import io
-                    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-                click.echo(csv_output)
+        with NotionService() as notion:
+            # データ取得
+            formatters.print_info("Notionからデータを取得中...")
+            projects = notion.iter_training_projects(
+                status_filter=status,
+                limit=limit,
+                start_date_from=date_from,
+                start_date_to=date_to,
+                amount_min=amount_min,
+                amount_max=amount_max
+            )
+
+            # 先頭の1件で結果の有無を確認し、残りは取得しながら出力する
+            first = next(projects, None)
+            if first is None:
+                formatters.print_warning("データが見つかりませんでした")
+                return
+            projects = chain([first], projects)
+
+            # フォーマットに応じて出力
+            if output_format == 'table':
+                formatters.format_table(list(projects))
+
+            elif output_format == 'detailed':
+                formatters.format_detailed(list(projects))
+
+            elif output_format == 'json':
+                records = (project.to_dict() for project in projects)
+                if output:
+                    with _atomic_output(output, 'wb', buffering=formatters.JSON_BUFFER_SIZE) as f:
+                        formatters.write_json_array(f, records)
+                    formatters.print_success(f"JSONファイルを出力しました: {output}")
+                else:
+                    # UTF-8 で出力
+                    _ensure_utf8_stdout()
+                    sys.stdout.flush()
+                    formatters.write_json_array(sys.stdout.buffer, records)
+                    sys.stdout.buffer.write(b"\n")
+                    sys.stdout.buffer.flush()
+
+            elif output_format == 'csv':
+                if output:
+                    with _atomic_output(
+                        output, 'w', encoding='utf-8', newline='',
+                        buffering=formatters.CSV_BUFFER_SIZE
+                    ) as f:
+                        formatters.format_csv(projects, f)
+                    formatters.print_success(f"CSVファイルを出力しました: {output}")
+                else:
+                    # UTF-8 で出力
+                    _ensure_utf8_stdout()
+                    formatters.format_csv(projects, sys.stdout)
 
     except NotionToMFError as e:
         formatters.print_error(f"エラー: {e}")
@@ -246,6 +304,11 @@ def fetch(
     default=True,
     help='統計情報を表示'
 )
+@click.option(
+    '--parallel',
+    is_flag=True,
+    help='請求書への変換を複数プロセスで並列実行'
+)
 def export(
     status: Optional[str],
     year: Optional[int],
@@ -257,7 +320,8 @@ def export(
     grouped: bool,
     output: str,
     skip_errors: bool,
-    show_stats: bool
+    show_stats: bool,
+    parallel: bool
 ):
     """研修案件を請求書形式でエクスポート
 
@@ -268,19 +332,24 @@ def export(
         notion-to-mf export --year 2025 --month 1 --grouped --output 2025-01.json
         notion-to-mf export --date-from 2025-01-01 --date-to 2025-03-31 --output q1.json
         notion-to-mf export --amount-min 100000 --output large-projects.json
+        notion-to-mf export --parallel --output invoices.json
     """
+    from ..services.notion import NotionService
+    from ..mappers.invoice_mapper import InvoiceMapper
+
+    # グループ化した請求書の変換は並列化に対応していない
+    if grouped and parallel:
+        raise click.UsageError("--grouped と --parallel は同時に指定できません")
+
     try:
         # 設定検証
         config.validate()
 
         # 年月フィルタをdate_from/date_toに変換
         if year or month:
-            from datetime import date as date_type
-            import calendar
-
             # 年が指定されていない場合は現在の年
             if not year:
-                year = date_type.today().year
+                year = date.today().year
 
             # 月が指定されている場合は該当月のみ
             if month:
@@ -298,64 +367,65 @@ def export(
                 date_to = f"{year:04d}-12-31"
 
         # サービス初期化
-        notion = NotionService()
-        mapper = InvoiceMapper()
-
-        # データ取得
-        formatters.print_info("Notionからデータを取得中...")
-        projects = notion.fetch_training_projects(
-            status_filter=status,
-            start_date_from=date_from,
-            start_date_to=date_to,
-            amount_min=amount_min,
-            amount_max=amount_max
-        )
-
-        if not projects:
-            formatters.print_warning("データが見つかりませんでした")
-            return
-
-        formatters.print_info(f"{len(projects)}件の研修案件を取得しました")
-
-        # 請求書に変換（グループ化オプションに応じて）
-        if grouped:
-            formatters.print_info("顧客×月でグループ化して請求書形式に変換中...")
-            invoices, errors = mapper.map_grouped_invoices(projects, skip_errors=skip_errors)
-        else:
-            formatters.print_info("請求書形式に変換中...")
-            invoices, errors = mapper.map_batch(projects, skip_errors=skip_errors)
-
-        if errors:
-            formatters.print_warning(f"{len(errors)}件のエラーがありました:")
-            for error in errors:
-                formatters.print_error(f"  - {error}")
-
-        if not invoices:
-            formatters.print_error("有効な請求書を作成できませんでした")
-            raise click.Abort()
-
-        # 統計情報の計算
-        if show_stats:
-            total_amount = sum(invoice.total_amount for invoice in invoices)
-            total_tax = sum(invoice.tax_amount for invoice in invoices)
-            total_subtotal = sum(invoice.subtotal for invoice in invoices)
-
-            formatters.print_info("\n=== 統計情報 ===")
-            click.echo(f"請求書件数: {len(invoices)}件")
-            click.echo(f"小計: {total_subtotal:,.0f}円（税抜）")
-            click.echo(f"消費税: {total_tax:,.0f}円")
-            click.echo(f"合計: {total_amount:,.0f}円（税込）")
-            click.echo()
-
-        # JSON出力
-        import json
-        invoice_data = [invoice.to_dict() for invoice in invoices]
-
-        with open(output, 'w', encoding='utf-8') as f:
-            json.dump(invoice_data, f, ensure_ascii=False, indent=2)
-
-        formatters.print_success(f"請求書データを出力しました: {output}")
-        formatters.print_success(f"{len(invoices)}件の請求書を作成しました")
+        with NotionService() as notion:
+            mapper = InvoiceMapper()
+
+            # データ取得
+            formatters.print_info("Notionからデータを取得中...")
+            projects = notion.fetch_training_projects(
+                status_filter=status,
+                start_date_from=date_from,
+                start_date_to=date_to,
+                amount_min=amount_min,
+                amount_max=amount_max
+            )
+
+            if not projects:
+                formatters.print_warning("データが見つかりませんでした")
+                return
+
+            formatters.print_info(f"{len(projects)}件の研修案件を取得しました")
+
+            # 請求書に変換（グループ化オプションに応じて）
+            if grouped:
+                formatters.print_info("顧客×月でグループ化して請求書形式に変換中...")
+                invoices, errors = mapper.map_grouped_invoices(projects, skip_errors=skip_errors)
+            else:
+                formatters.print_info("請求書形式に変換中...")
+                invoices, errors = mapper.map_batch(
+                    projects, skip_errors=skip_errors, parallel=parallel
+                )
+
+            if errors:
+                formatters.print_warning(f"{len(errors)}件のエラーがありました:")
+                for error in errors:
+                    formatters.print_error(f"  - {error}")
+
+            if not invoices:
+                formatters.print_error("有効な請求書を作成できませんでした")
+                raise click.Abort()
+
+            # 統計情報の計算
+            if show_stats:
+                total_amount = total_tax = total_subtotal = Decimal(0)
+                for invoice in invoices:
+                    total_amount += invoice.total_amount
+                    total_tax += invoice.tax_amount
+                    total_subtotal += invoice.subtotal
+
+                formatters.print_info("\n=== 統計情報 ===")
+                click.echo(f"請求書件数: {len(invoices)}件")
+                click.echo(f"小計: {total_subtotal:,.0f}円（税抜）")
+                click.echo(f"消費税: {total_tax:,.0f}円")
+                click.echo(f"合計: {total_amount:,.0f}円（税込）")
+                click.echo()
+
+            # JSON出力（1件ずつバッファ経由で書き出し）
+            with open(output, 'wb', buffering=formatters.JSON_BUFFER_SIZE) as f:
+                formatters.write_json_array(f, (invoice.to_dict() for invoice in invoices))
+
+            formatters.print_success(f"請求書データを出力しました: {output}")
+            formatters.print_success(f"{len(invoices)}件の請求書を作成しました")
 
     except NotionToMFError as e:
         formatters.print_error(f"エラー: {e}")
@@ -377,23 +447,26 @@ def auth():
     例:
         python -m src auth
     """
+    from ..services.moneyforward import MoneyForwardService
+    from ..utils.auth import MoneyForwardAuth
+
     try:
         formatters.print_info("MoneyForward OAuth 2.0認証を開始します...")
         formatters.print_info("ブラウザが開きます。MoneyForwardにログインして認可してください。")
 
-        auth_client = MoneyForwardAuth()
-        token_data = auth_client.authenticate()
+        with MoneyForwardAuth() as auth_client:
+            token_data = auth_client.authenticate()
 
         formatters.print_success("認証が完了しました！")
         formatters.print_info("これでMoneyForward APIを使用できます")
 
         # 接続テスト
         formatters.print_info("接続をテスト中...")
-        mf_service = MoneyForwardService()
-        if mf_service.test_connection():
-            formatters.print_success("MoneyForward APIに正常に接続できました")
-        else:
-            formatters.print_warning("接続テストに失敗しました")
+        with MoneyForwardService() as mf_service:
+            if mf_service.test_connection():
+                formatters.print_success("MoneyForward APIに正常に接続できました")
+            else:
+                formatters.print_warning("接続テストに失敗しました")
 
     except AuthenticationError as e:
         formatters.print_error(f"認証エラー: {e}")
@@ -426,78 +499,82 @@ def create_invoice(notion_id: Optional[str], dry_run: bool):
         python -m src create-invoice --notion-id 12345
         python -m src create-invoice --dry-run
     """
+    from ..services.notion import NotionService
+    from ..services.moneyforward import MoneyForwardService
+    from ..mappers.invoice_mapper import InvoiceMapper
+
     try:
         # 設定検証
         config.validate()
 
         # サービス初期化
-        notion = NotionService()
-        mf_service = MoneyForwardService()
-        mapper = InvoiceMapper()
-
-        # Notion案件を選択
-        if notion_id:
-            # 指定されたIDの案件を取得（実装簡略化のため、ここではエラー）
-            formatters.print_error("--notion-id オプションは未実装です")
-            formatters.print_info("現在は対話式選択のみサポートしています")
-            raise click.Abort()
-
-        # 最近の完了案件を取得
-        formatters.print_info("最近の完了案件を取得中...")
-        projects = notion.fetch_training_projects(
-            status_filter='完了',
-            limit=10
-        )
-
-        if not projects:
-            formatters.print_warning("完了した案件が見つかりませんでした")
-            return
-
-        # 案件を選択
-        formatters.print_info(f"\n{len(projects)}件の案件が見つかりました:")
-        for i, project in enumerate(projects, 1):
-            click.echo(f"{i}. {project.title} - {project.format_amount()}")
-
-        choice = click.prompt('\n作成する案件番号を選択してください', type=int)
-
-        if choice < 1 or choice > len(projects):
-            formatters.print_error("無効な選択です")
-            raise click.Abort()
-
-        selected_project = projects[choice - 1]
-
-        # 請求書に変換
-        formatters.print_info(f"\n請求書を作成中: {selected_project.title}")
-        invoice = mapper.map_to_invoice(selected_project)
-
-        # プレビュー表示
-        formatters.print_info("\n=== 請求書プレビュー ===")
-        click.echo(invoice.format_summary())
-
-        if dry_run:
-            formatters.print_info("\n[DRY RUN] 実際には作成しません")
-            return
-
-        # 確認
-        if not click.confirm('\nこの請求書をMoneyForwardに作成しますか？'):
-            formatters.print_info("キャンセルしました")
-            return
-
-        # MoneyForwardに作成
-        formatters.print_info("MoneyForwardに請求書を作成中...")
-        result = mf_service.create_invoice(invoice)
-
-        formatters.print_success("請求書を作成しました！")
-        if 'id' in result:
-            formatters.print_info(f"請求書ID: {result['id']}")
-
-        # 請求済みフラグを更新
-        if invoice.source_id:
-            formatters.print_info("Notionの請求済みフラグを更新中...")
-            if notion.update_invoiced_status(invoice.source_id):
-                formatters.print_success("請求済みフラグを更新しました")
-            else:
-                formatters.print_warning("請求済みフラグの更新に失敗しました")
+        with NotionService() as notion:
+            mapper = InvoiceMapper()
+
+            # Notion案件を選択
+            if notion_id:
+                # 指定されたIDの案件を取得（実装簡略化のため、ここではエラー）
+                formatters.print_error("--notion-id オプションは未実装です")
+                formatters.print_info("現在は対話式選択のみサポートしています")
+                raise click.Abort()
+
+            # 最近の完了案件を取得
+            formatters.print_info("最近の完了案件を取得中...")
+            projects = notion.fetch_training_projects(
+                status_filter='完了',
+                limit=10
+            )
+
+            if not projects:
+                formatters.print_warning("完了した案件が見つかりませんでした")
+                return
+
+            # 案件を選択
+            formatters.print_info(f"\n{len(projects)}件の案件が見つかりました:")
+            for i, project in enumerate(projects, 1):
+                click.echo(f"{i}. {project.title} - {project.format_amount()}")
+
+            choice = click.prompt('\n作成する案件番号を選択してください', type=int)
+
+            if choice < 1 or choice > len(projects):
+                formatters.print_error("無効な選択です")
+                raise click.Abort()
+
+            selected_project = projects[choice - 1]
+
+            # 請求書に変換
+            formatters.print_info(f"\n請求書を作成中: {selected_project.title}")
+            invoice = mapper.map_to_invoice(selected_project)
+
+            # プレビュー表示
+            formatters.print_info("\n=== 請求書プレビュー ===")
+            click.echo(invoice.format_summary())
+
+            if dry_run:
+                formatters.print_info("\n[DRY RUN] 実際には作成しません")
+                return
+
+            # 確認
+            if not click.confirm('\nこの請求書をMoneyForwardに作成しますか？'):
+                formatters.print_info("キャンセルしました")
+                return
+
+            # MoneyForwardに作成
+            formatters.print_info("MoneyForwardに請求書を作成中...")
+            with MoneyForwardService() as mf_service:
+                result = mf_service.create_invoice(invoice)
+
+            formatters.print_success("請求書を作成しました！")
+            if 'id' in result:
+                formatters.print_info(f"請求書ID: {result['id']}")
+
+            # 請求済みフラグを更新
+            if invoice.source_id:
+                formatters.print_info("Notionの請求済みフラグを更新中...")
+                if notion.update_invoiced_status(invoice.source_id):
+                    formatters.print_success("請求済みフラグを更新しました")
+                else:
+                    formatters.print_warning("請求済みフラグの更新に失敗しました")
 
     except NotionToMFError as e:
         formatters.print_error(f"エラー: {e}")
@@ -525,7 +602,12 @@ def create_invoice(notion_id: Optional[str], dry_run: bool):
     type=int,
     help='処理する件数の上限'
 )
-def sync(status: str, dry_run: bool, limit: Optional[int]):
+@click.option(
+    '--parallel',
+    is_flag=True,
+    help='請求書への変換を複数プロセスで並列実行'
+)
+def sync(status: str, dry_run: bool, limit: Optional[int], parallel: bool):
     """Notionの案件をMoneyForwardに自動同期
 
     \b
@@ -538,93 +620,107 @@ def sync(status: str, dry_run: bool, limit: Optional[int]):
         python -m src sync --dry-run
         python -m src sync --limit 5
     """
+    from ..services.notion import NotionService
+    from ..services.moneyforward import MoneyForwardService
+    from ..mappers.invoice_mapper import InvoiceMapper
+
     try:
         # 設定検証
         config.validate()
 
         # サービス初期化
-        notion = NotionService()
-        mf_service = MoneyForwardService()
-        mapper = InvoiceMapper()
-
-        # データ取得
-        formatters.print_info(f"Notionから{status}の案件を取得中...")
-        projects = notion.fetch_training_projects(
-            status_filter=status,
-            limit=limit
-        )
-
-        if not projects:
-            formatters.print_warning("データが見つかりませんでした")
-            return
-
-        formatters.print_info(f"{len(projects)}件の案件を取得しました")
-
-        # 請求書に変換
-        formatters.print_info("請求書形式に変換中...")
-        invoices, errors = mapper.map_batch(projects, skip_errors=True)
-
-        if errors:
-            formatters.print_warning(f"{len(errors)}件のエラーがありました:")
-            for error in errors[:5]:  # 最初の5件のみ表示
-                formatters.print_error(f"  - {error}")
-
-        if not invoices:
-            formatters.print_error("有効な請求書を作成できませんでした")
-            raise click.Abort()
-
-        formatters.print_info(f"{len(invoices)}件の請求書を作成します")
-
-        if dry_run:
-            formatters.print_info("\n[DRY RUN] 実際には作成しません")
-            for i, invoice in enumerate(invoices[:5], 1):
-                click.echo(f"\n{i}. {invoice.project_name}")
-                click.echo(f"   {invoice.format_summary()}")
-            return
-
-        # 確認
-        if not click.confirm(f'\n{len(invoices)}件の請求書をMoneyForwardに作成しますか？'):
-            formatters.print_info("キャンセルしました")
-            return
-
-        # MoneyForwardに一括作成
-        formatters.print_info("MoneyForwardに請求書を作成中...")
-        created_count = 0
-        failed_count = 0
-        invoiced_project_ids = []
-
-        for invoice in invoices:
-            try:
-                mf_service.create_invoice(invoice)
-                created_count += 1
-                formatters.print_success(f"作成完了: {invoice.project_name}")
-
-                # 請求書作成成功後、元の案件IDを記録
-                if invoice.source_ids:
-                    # グループ化請求書の場合
-                    invoiced_project_ids.extend(invoice.source_ids)
-                elif invoice.source_id:
-                    # 通常の請求書の場合
-                    invoiced_project_ids.append(invoice.source_id)
-
-            except Exception as e:
-                failed_count += 1
-                formatters.print_error(f"作成失敗: {invoice.project_name} - {e}")
-
-        # 請求済みフラグを更新
-        if invoiced_project_ids:
-            formatters.print_info("Notionの請求済みフラグを更新中...")
-            success, failed = notion.mark_projects_as_invoiced(invoiced_project_ids)
-            if success > 0:
-                formatters.print_success(f"請求済みフラグを更新: {success}件")
-            if failed > 0:
-                formatters.print_warning(f"フラグ更新失敗: {failed}件")
-
-        # 結果表示
-        formatters.print_info(f"\n=== 同期結果 ===")
-        formatters.print_success(f"成功: {created_count}件")
-        if failed_count > 0:
-            formatters.print_error(f"失敗: {failed_count}件")
+        with NotionService() as notion:
+            mapper = InvoiceMapper()
+
+            # データ取得
+            formatters.print_info(f"Notionから{status}の案件を取得中...")
+            projects = notion.fetch_training_projects(
+                status_filter=status,
+                limit=limit
+            )
+
+            if not projects:
+                formatters.print_warning("データが見つかりませんでした")
+                return
+
+            formatters.print_info(f"{len(projects)}件の案件を取得しました")
+
+            # 請求書に変換
+            formatters.print_info("請求書形式に変換中...")
+            invoices, errors = mapper.map_batch(projects, skip_errors=True, parallel=parallel)
+
+            if errors:
+                formatters.print_warning(f"{len(errors)}件のエラーがありました:")
+                for error in errors[:5]:  # 最初の5件のみ表示
+                    formatters.print_error(f"  - {error}")
+
+            if not invoices:
+                formatters.print_error("有効な請求書を作成できませんでした")
+                raise click.Abort()
+
+            formatters.print_info(f"{len(invoices)}件の請求書を作成します")
+
+            if dry_run:
+                formatters.print_info("\n[DRY RUN] 実際には作成しません")
+                for i, invoice in enumerate(invoices[:5], 1):
+                    click.echo(f"\n{i}. {invoice.project_name}")
+                    click.echo(f"   {invoice.format_summary()}")
+                return
+
+            # 確認
+            if not click.confirm(f'\n{len(invoices)}件の請求書をMoneyForwardに作成しますか？'):
+                formatters.print_info("キャンセルしました")
+                return
+
+            # MoneyForwardに一括作成
+            formatters.print_info("MoneyForwardに請求書を作成中...")
+            created_count = 0
+            failed_count = 0
+            invoiced_project_ids = []
+
+            # レート制限を守りながら並列に作成（セッションは全リクエストで共有）
+            limiter = RateLimiter(config.MONEYFORWARD_RATE_LIMIT)
+
+            def submit_invoice(invoice):
+                limiter.wait()
+                return mf_service.create_invoice(invoice)
+
+            with MoneyForwardService() as mf_service, \
+                    ThreadPoolExecutor(max_workers=max(1, config.MONEYFORWARD_CONCURRENCY)) as executor:
+                futures = {executor.submit(submit_invoice, invoice): invoice for invoice in invoices}
+                for future in as_completed(futures):
+                    invoice = futures[future]
+                    try:
+                        future.result()
+                        created_count += 1
+                        formatters.print_success(f"作成完了: {invoice.project_name}")
+
+                        # 請求書作成成功後、元の案件IDを記録
+                        if invoice.source_ids:
+                            # グループ化請求書の場合
+                            invoiced_project_ids.extend(invoice.source_ids)
+                        elif invoice.source_id:
+                            # 通常の請求書の場合
+                            invoiced_project_ids.append(invoice.source_id)
+
+                    except Exception as e:
+                        failed_count += 1
+                        formatters.print_error(f"作成失敗: {invoice.project_name} - {e}")
+
+            # 請求済みフラグを更新
+            if invoiced_project_ids:
+                formatters.print_info("Notionの請求済みフラグを更新中...")
+                success, failed = notion.mark_projects_as_invoiced(invoiced_project_ids)
+                if success > 0:
+                    formatters.print_success(f"請求済みフラグを更新: {success}件")
+                if failed > 0:
+                    formatters.print_warning(f"フラグ更新失敗: {failed}件")
+
+            # 結果表示
+            formatters.print_info(f"\n=== 同期結果 ===")
+            formatters.print_success(f"成功: {created_count}件")
+            if failed_count > 0:
+                formatters.print_error(f"失敗: {failed_count}件")
 
     except NotionToMFError as e:
         formatters.print_error(f"エラー: {e}")
@@ -1,15 +1,47 @@
 """CLI出力フォーマッター"""
-import json
-from typing import List, Optional
+import csv
+import io
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator, List, Optional, TextIO
+import orjson
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 from rich import box
-from ..models.training_project import TrainingProject
+
+if TYPE_CHECKING:
+    # 型注釈のみで使用（pydanticモデルの読み込みを起動時に行わない）
+    from ..models.training_project import TrainingProject
 
 console = Console()
 
+# print_info などのメッセージの出力先（通常は console と同じ標準出力）
+_message_console = console
+
+# ファイル出力時の書き込みバッファサイズ
+JSON_BUFFER_SIZE = 1024 * 1024
+CSV_BUFFER_SIZE = 256 * 1024
+
+# JSON整形出力のオプション
+_JSON_PRETTY = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# ステータスごとの表示色
+_STATUS_COLORS = {
+    "受注": "yellow",
+    "実施中": "blue",
+    "完了": "green",
+}
+
+# CSVヘッダー
+_CSV_HEADERS = (
+    "案件名", "ステータス", "顧客名", "金額",
+    "開始日", "終了日", "場所", "形式",
+    "参加人数", "日数", "備考",
+)
+
 
-def format_table(projects: List[TrainingProject]) -> None:
+def format_table(projects: List["TrainingProject"]) -> None:
     """テーブル形式で表示
 
     Args:
@@ -23,7 +55,8 @@ def format_table(projects: List[TrainingProject]) -> None:
         title=f"研修案件一覧 ({len(projects)}件)",
         box=box.ROUNDED,
         show_header=True,
-        header_style="bold cyan"
+        header_style="bold cyan",
+        highlight=False
     )
 
     # カラム定義
@@ -34,23 +67,21 @@ def format_table(projects: List[TrainingProject]) -> None:
     table.add_column("期間", style="cyan", width=20)
 
     # データ追加
+    # セルはTextで渡し、行ごとのマークアップ解析を行わない
     for project in projects:
-        # ステータスに応じて色を変える
-        status_color = _get_status_color(project.status)
-        status_text = f"[{status_color}]{project.status or '-'}[/{status_color}]"
-
         table.add_row(
-            project.title,
-            status_text,
-            project.customer_name or "-",
-            project.format_amount(),
-            project.format_date_range()
+            Text(project.title),
+            # ステータスに応じて色を変える
+            Text(project.status or "-", style=_get_status_color(project.status)),
+            Text(project.customer_name or "-"),
+            Text(project.format_amount()),
+            Text(project.format_date_range())
         )
 
     console.print(table)
 
 
-def format_detailed(projects: List[TrainingProject]) -> None:
+def format_detailed(projects: List["TrainingProject"]) -> None:
     """詳細形式で表示
 
     Args:
@@ -60,90 +91,100 @@ def format_detailed(projects: List[TrainingProject]) -> None:
         console.print("[yellow]データが見つかりませんでした[/yellow]")
         return
 
-    console.print(f"\n[bold cyan]研修案件一覧 ({len(projects)}件)[/bold cyan]\n")
+    # 出力をまとめてバッファリングし、最後に1回だけ書き出す
+    with console:
+        console.print(f"\n[bold cyan]研修案件一覧 ({len(projects)}件)[/bold cyan]\n")
+
+        for i, project in enumerate(projects, 1):
+            lines = [
+                f"[bold white]━━━ {i}. {project.title} ━━━[/bold white]",
+                f"  [cyan]ステータス:[/cyan] {project.status or '-'}",
+                f"  [cyan]顧客名:[/cyan] {project.customer_name or '-'}",
+                f"  [cyan]金額:[/cyan] {project.format_amount()} (税抜)",
+                f"  [cyan]期間:[/cyan] {project.format_date_range()}",
+            ]
 
-    for i, project in enumerate(projects, 1):
-        console.print(f"[bold white]━━━ {i}. {project.title} ━━━[/bold white]")
-        console.print(f"  [cyan]ステータス:[/cyan] {project.status or '-'}")
-        console.print(f"  [cyan]顧客名:[/cyan] {project.customer_name or '-'}")
-        console.print(f"  [cyan]金額:[/cyan] {project.format_amount()} (税抜)")
-        console.print(f"  [cyan]期間:[/cyan] {project.format_date_range()}")
+            if project.location:
+                lines.append(f"  [cyan]場所:[/cyan] {project.location}")
 
-        if project.location:
-            console.print(f"  [cyan]場所:[/cyan] {project.location}")
+            if project.format:
+                lines.append(f"  [cyan]形式:[/cyan] {project.format}")
 
-        if project.format:
-            console.print(f"  [cyan]形式:[/cyan] {project.format}")
+            if project.participants:
+                lines.append(f"  [cyan]参加人数:[/cyan] {project.participants}名")
 
-        if project.participants:
-            console.print(f"  [cyan]参加人数:[/cyan] {project.participants}名")
+            if project.days:
+                lines.append(f"  [cyan]日数:[/cyan] {project.days}日")
 
-        if project.days:
-            console.print(f"  [cyan]日数:[/cyan] {project.days}日")
+            if project.notes:
+                lines.append(f"  [cyan]備考:[/cyan] {project.notes}")
 
-        if project.notes:
-            console.print(f"  [cyan]備考:[/cyan] {project.notes}")
+            # 案件ごとに1回のprintで出力（末尾は空行）
+            lines.append("")
+            console.print("\n".join(lines))
 
-        console.print()
 
+def write_json_array(fp: BinaryIO, records: Iterable[dict]) -> int:
+    """JSON配列を1要素ずつファイルに書き出し
 
-def format_json(projects: List[TrainingProject], pretty: bool = True) -> str:
-    """JSON形式で出力
+    リスト全体を組み立てずに、インデント2の整形JSONと同じ形式で出力する
 
     Args:
-        projects: 研修案件リスト
-        pretty: 整形するかどうか
+        fp: 書き込み先（バイナリモード）
+        records: 出力する辞書のイテラブル
 
     Returns:
-        JSON文字列
+        出力した件数
     """
-    data = [project.to_dict() for project in projects]
+    count = 0
+    for record in records:
+        body = orjson.dumps(record, default=_json_default, option=_JSON_PRETTY)
+        fp.write(b",\n  " if count else b"[\n  ")
+        fp.write(body.replace(b"\n", b"\n  "))
+        count += 1
 
-    if pretty:
-        return json.dumps(data, ensure_ascii=False, indent=2)
-    else:
-        return json.dumps(data, ensure_ascii=False)
+    fp.write(b"\n]" if count else b"[]")
+    return count
 
 
-def format_csv(projects: List[TrainingProject]) -> str:
+def format_csv(
+    projects: Iterable["TrainingProject"],
+    fp: Optional[TextIO] = None
+) -> Optional[str]:
     """CSV形式で出力
 
     Args:
         projects: 研修案件リスト
+        fp: 書き込み先（指定しない場合は文字列として返す）
 
     Returns:
-        CSV文字列
+        CSV文字列（fpを指定した場合はNone）
     """
-    if not projects:
-        return ""
+    target = fp if fp is not None else io.StringIO()
 
-    # ヘッダー
-    headers = [
-        "案件名", "ステータス", "顧客名", "金額",
-        "開始日", "終了日", "場所", "形式",
-        "参加人数", "日数", "備考"
-    ]
+    # エスケープはcsvモジュールに任せる
+    writer = csv.writer(target, lineterminator="\n")
+    writer.writerow(_CSV_HEADERS)
+    writer.writerows(_csv_row(project) for project in projects)
 
-    lines = [",".join(headers)]
+    if fp is None:
+        return target.getvalue()
+    return None
 
-    # データ行
-    for project in projects:
-        row = [
-            _escape_csv(project.title),
-            _escape_csv(project.status or ""),
-            _escape_csv(project.customer_name or ""),
-            str(project.amount or 0),
-            project.start_date.strftime("%Y-%m-%d") if project.start_date else "",
-            project.end_date.strftime("%Y-%m-%d") if project.end_date else "",
-            _escape_csv(project.location or ""),
-            _escape_csv(project.format or ""),
-            str(project.participants or ""),
-            str(project.days or ""),
-            _escape_csv(project.notes or ""),
-        ]
-        lines.append(",".join(row))
-
-    return "\n".join(lines)
+
+@contextmanager
+def messages_to_stderr() -> Iterator[None]:
+    """メッセージの出力先を一時的に標準エラー出力に切り替える
+
+    JSON/CSVを標準出力に書き出す場合に、データとメッセージが混ざらないようにする
+    """
+    global _message_console
+    previous = _message_console
+    _message_console = Console(stderr=True)
+    try:
+        yield
+    finally:
+        _message_console = previous
 
 
 def print_success(message: str) -> None:
@@ -152,7 +193,7 @@ def print_success(message: str) -> None:
     Args:
         message: メッセージ
     """
-    console.print(f"[green][OK][/green] {message}")
+    _message_console.print(f"[green][OK][/green] {message}")
 
 
 def print_error(message: str) -> None:
@@ -161,7 +202,7 @@ def print_error(message: str) -> None:
     Args:
         message: メッセージ
     """
-    console.print(f"[red][ERROR][/red] {message}", style="bold red")
+    _message_console.print(f"[red][ERROR][/red] {message}", style="bold red")
 
 
 def print_warning(message: str) -> None:
@@ -170,7 +211,7 @@ def print_warning(message: str) -> None:
     Args:
         message: メッセージ
     """
-    console.print(f"[yellow][WARNING][/yellow] {message}", style="yellow")
+    _message_console.print(f"[yellow][WARNING][/yellow] {message}", style="yellow")
 
 
 def print_info(message: str) -> None:
@@ -179,7 +220,7 @@ def print_info(message: str) -> None:
     Args:
         message: メッセージ
     """
-    console.print(f"[blue][INFO][/blue] {message}", style="blue")
+    _message_console.print(f"[blue][INFO][/blue] {message}", style="blue")
 
 
 def _get_status_color(status: Optional[str]) -> str:
@@ -191,28 +232,42 @@ def _get_status_color(status: Optional[str]) -> str:
     Returns:
         色名
     """
-    if not status:
-        return "white"
+    return _STATUS_COLORS.get(status, "white") if status else "white"
 
-    status_colors = {
-        "受注": "yellow",
-        "実施中": "blue",
-        "完了": "green",
-    }
 
-    return status_colors.get(status, "white")
+def _json_default(value: Any) -> Any:
+    """orjsonが直接扱えない型を変換
 
+    Args:
+        value: 値
 
-def _escape_csv(value: str) -> str:
-    """CSV用にエスケープ
+    Returns:
+        JSONに変換可能な値
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"JSONに変換できない型です: {type(value).__name__}")
+
+
+def _csv_row(project: "TrainingProject") -> tuple:
+    """CSVの1行分の値を作成
 
     Args:
-        value: 値
+        project: 研修案件
 
     Returns:
-        エスケープ済み文字列
+        行の値
     """
-    if "," in value or '"' in value or "\n" in value:
-        escaped = value.replace('"', '""')
-        return f'"{escaped}"'
-    return value
+    return (
+        project.title,
+        project.status or "",
+        project.customer_name or "",
+        str(project.amount or 0),
+        project.start_date.date().isoformat() if project.start_date else "",
+        project.end_date.date().isoformat() if project.end_date else "",
+        project.location or "",
+        project.format or "",
+        str(project.participants or ""),
+        str(project.days or ""),
+        project.notes or "",
+    )
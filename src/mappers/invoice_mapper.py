@@ -1,18 +1,86 @@
 """Notionデータから請求書への変換マッパー"""
+import calendar
+import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, timedelta
-from decimal import Decimal
-from typing import Optional
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache, partial
+from itertools import chain
+from typing import Optional, Union
 from ..models.training_project import TrainingProject
-from ..models.invoice import Invoice, InvoiceItem
+from ..models.invoice import TAX_QUANTIZE, Invoice, InvoiceItem
 from ..utils.logger import setup_logger
 from ..utils.exceptions import DataValidationError
 
 logger = setup_logger(__name__)
 
 
+def _to_decimal(value: Union[Decimal, float, int]) -> Decimal:
+    """金額をDecimalに変換（既にDecimalの場合はそのまま返す）
+
+    Args:
+        value: 金額
+
+    Returns:
+        Decimal値
+    """
+    if isinstance(value, Decimal):
+        return value
+    return _number_to_decimal(value)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _number_to_decimal(value: Union[float, int]) -> Decimal:
+    """数値をDecimalに変換（単価が同じ案件は多いため結果をキャッシュ）
+
+    typed=True とし、1 と 1.0 のように表記が異なる値を別々にキャッシュする
+
+    Args:
+        value: 金額
+
+    Returns:
+        Decimal値
+    """
+    return Decimal(str(value))
+
+
+def _invalid_reason(project: TrainingProject) -> Optional[str]:
+    """グループ化できない案件の理由を返す
+
+    Args:
+        project: 研修案件データ
+
+    Returns:
+        不正な理由（問題がなければNone）
+    """
+    if not project.customer_name:
+        return "顧客名が設定されていません"
+
+    if not project.start_date:
+        return "開始日が設定されていません"
+
+    if project.amount is None or project.amount <= 0:
+        return f"金額が不正です ({project.amount})"
+
+    return None
+
+
 class InvoiceMapper:
     """請求書データマッピングクラス"""
 
+    # この件数以上の場合のみ並列変換する（プロセス起動のコストを回収できないため）
+    PARALLEL_MIN_PROJECTS = 500
+
+    # 明細の説明に含める項目（属性名, ラベル, 書式）
+    _DESC_FIELDS = (
+        ("participants", "参加人数", "{}名"),
+        ("days", "日数", "{}日"),
+        ("location", "場所", "{}"),
+        ("format", "形式", "{}"),
+    )
+
     def __init__(self, tax_rate: Decimal = Decimal("0.10")):
         """初期化
 
@@ -54,16 +122,20 @@ class InvoiceMapper:
         items = self._create_invoice_items(project)
 
         # 小計の計算
-        subtotal = sum(item.amount for item in items)
+        subtotal = Decimal(0)
+        for item in items:
+            subtotal += item.amount
 
         # 消費税の計算
-        tax_amount = (subtotal * self.tax_rate).quantize(Decimal("0"))
+        tax_amount = (subtotal * self.tax_rate).quantize(
+            TAX_QUANTIZE, rounding=ROUND_HALF_UP
+        )
 
         # 合計金額
         total_amount = subtotal + tax_amount
 
-        # 請求書作成
-        invoice = Invoice(
+        # 請求書作成（_validate_project で検証済みのため、pydanticの検証を省略）
+        invoice = Invoice.model_construct(
             invoice_date=invoice_date,
             due_date=due_date,
             customer_name=project.customer_name or "顧客名未設定",
@@ -78,7 +150,9 @@ class InvoiceMapper:
             project_name=project.title,
         )
 
-        logger.info(f"請求書を作成しました: {project.title} - {total_amount:,.0f}円")
+        # 桁区切りの整形はINFOが有効な場合のみ行う
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"請求書を作成しました: {project.title} - {total_amount:,.0f}円")
         return invoice
 
     def _validate_project(self, project: TrainingProject) -> None:
@@ -137,22 +211,28 @@ class InvoiceMapper:
         items = []
 
         # メイン明細
+        amount = _to_decimal(project.amount)
         main_item = InvoiceItem(
             item_name=project.title,
             quantity=1,
-            unit_price=Decimal(str(project.amount)),
-            amount=Decimal(str(project.amount)),
+            unit_price=amount,
+            amount=amount,
             description=self._create_item_description(project),
         )
         items.append(main_item)
 
         return items
 
-    def _create_item_description(self, project: TrainingProject) -> str:
+    def _create_item_description(
+        self,
+        project: TrainingProject,
+        date_range: Optional[str] = None
+    ) -> str:
         """明細の説明を作成
 
         Args:
             project: 研修案件データ
+            date_range: 整形済みの実施期間（指定なしの場合はここで整形）
 
         Returns:
             説明文
@@ -160,20 +240,14 @@ class InvoiceMapper:
         parts = []
 
         if project.start_date and project.end_date:
-            date_range = project.format_date_range()
+            if date_range is None:
+                date_range = project.format_date_range()
             parts.append(f"実施期間: {date_range}")
 
-        if project.participants:
-            parts.append(f"参加人数: {project.participants}名")
-
-        if project.days:
-            parts.append(f"日数: {project.days}日")
-
-        if project.location:
-            parts.append(f"場所: {project.location}")
-
-        if project.format:
-            parts.append(f"形式: {project.format}")
+        for name, label, fmt in self._DESC_FIELDS:
+            value = getattr(project, name)
+            if value:
+                parts.append(f"{label}: {fmt.format(value)}")
 
         return " / ".join(parts) if parts else ""
 
@@ -198,13 +272,18 @@ class InvoiceMapper:
     def map_batch(
         self,
         projects: list[TrainingProject],
-        skip_errors: bool = True
+        skip_errors: bool = True,
+        parallel: bool = False,
+        workers: Optional[int] = None
     ) -> tuple[list[Invoice], list[str]]:
         """複数の研修案件を一括変換
 
         Args:
             projects: 研修案件のリスト
             skip_errors: エラーをスキップするか
+            parallel: 複数プロセスで並列に変換するか
+                （PARALLEL_MIN_PROJECTS 件未満の場合は逐次処理）
+            workers: 並列変換時のプロセス数（指定なしの場合はCPU数）
 
         Returns:
             (成功した請求書のリスト, エラーメッセージのリスト)
@@ -212,21 +291,66 @@ class InvoiceMapper:
         invoices = []
         errors = []
 
-        for project in projects:
-            try:
-                invoice = self.map_to_invoice(project)
+        if parallel and len(projects) >= self.PARALLEL_MIN_PROJECTS:
+            results = self._map_chunks_parallel(projects, workers or os.cpu_count() or 1)
+        else:
+            results = (_map_project(self, project) for project in projects)
+
+        for project, (invoice, error) in zip(projects, results):
+            if error is None:
                 invoices.append(invoice)
-            except DataValidationError as e:
-                error_msg = f"{project.title}: {str(e)}"
-                errors.append(error_msg)
-                logger.warning(f"請求書作成をスキップ: {error_msg}")
+                continue
 
-                if not skip_errors:
-                    raise
+            error_msg = f"{project.title}: {str(error)}"
+            errors.append(error_msg)
+            logger.warning("請求書作成をスキップ: %s", error_msg)
+
+            if not skip_errors:
+                raise error
 
-        logger.info(f"バッチ変換完了: {len(invoices)}件成功, {len(errors)}件エラー")
+        logger.info("バッチ変換完了: %d件成功, %d件エラー", len(invoices), len(errors))
         return invoices, errors
 
+    def map_batch_parallel(
+        self,
+        projects: list[TrainingProject],
+        workers: int = 4,
+        skip_errors: bool = True
+    ) -> tuple[list[Invoice], list[str]]:
+        """複数の研修案件を複数プロセスで一括変換
+
+        Args:
+            projects: 研修案件のリスト
+            workers: プロセス数
+            skip_errors: エラーをスキップするか
+
+        Returns:
+            (成功した請求書のリスト, エラーメッセージのリスト)
+        """
+        return self.map_batch(projects, skip_errors=skip_errors, parallel=True, workers=workers)
+
+    def _map_chunks_parallel(
+        self,
+        projects: list[TrainingProject],
+        workers: int
+    ) -> list[tuple[Optional[Invoice], Optional[DataValidationError]]]:
+        """案件をプロセス数で分割し、チャンク単位で並列に変換
+
+        Args:
+            projects: 研修案件のリスト
+            workers: プロセス数
+
+        Returns:
+            projects と同じ順序の (請求書, 検証エラー) のリスト
+        """
+        size = -(-len(projects) // workers)
+        chunks = [projects[i:i + size] for i in range(0, len(projects), size)]
+
+        # マッパー自体ではなく税率の文字列を渡し、各プロセスで復元する
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            results = executor.map(partial(_map_chunk, str(self.tax_rate)), chunks)
+            return list(chain.from_iterable(results))
+
     def map_grouped_invoices(
         self,
         projects: list[TrainingProject],
@@ -241,68 +365,56 @@ class InvoiceMapper:
         Returns:
             (成功した請求書のリスト, エラーメッセージのリスト)
         """
-        from collections import defaultdict
-        from datetime import date as date_type
-        import calendar
-
         # 顧客×月でグループ化
         groups = defaultdict(list)
         errors = []
 
         for project in projects:
-            try:
-                # データ検証
-                if not project.customer_name:
-                    if not skip_errors:
-                        raise DataValidationError(f"{project.title}: 顧客名が設定されていません")
-                    errors.append(f"{project.title}: 顧客名が設定されていません")
-                    continue
-
-                if not project.start_date:
-                    if not skip_errors:
-                        raise DataValidationError(f"{project.title}: 開始日が設定されていません")
-                    errors.append(f"{project.title}: 開始日が設定されていません")
-                    continue
-
-                if project.amount is None or project.amount <= 0:
-                    if not skip_errors:
-                        raise DataValidationError(f"{project.title}: 金額が不正です")
-                    errors.append(f"{project.title}: 金額が不正です ({project.amount})")
-                    continue
-
-                # 顧客名と年月でグループ化キーを作成
-                year_month = (project.start_date.year, project.start_date.month)
-                group_key = (project.customer_name, year_month)
-                groups[group_key].append(project)
-
-            except Exception as e:
-                error_msg = f"{project.title}: {str(e)}"
-                errors.append(error_msg)
-                logger.warning(f"グループ化をスキップ: {error_msg}")
+            # データ検証（例外を使わずに不正な案件を除外）
+            reason = _invalid_reason(project)
+            if reason is not None:
+                error_msg = f"{project.title}: {reason}"
                 if not skip_errors:
-                    raise
+                    raise DataValidationError(error_msg)
+                errors.append(error_msg)
+                continue
+
+            # 顧客名と年月でグループ化
+            start_date = project.start_date
+            groups[(project.customer_name, start_date.year, start_date.month)].append(project)
 
         # 各グループを請求書に変換
         invoices = []
-        for (customer_name, (year, month)), group_projects in groups.items():
+        month_ends: dict[tuple[int, int], date] = {}
+        for (customer_name, year, month), group_projects in groups.items():
             try:
+                # 請求日（月末日）は同じ年月のグループで共有
+                invoice_date = month_ends.get((year, month))
+                if invoice_date is None:
+                    invoice_date = date(year, month, calendar.monthrange(year, month)[1])
+                    month_ends[(year, month)] = invoice_date
+
                 invoice = self._create_grouped_invoice(
                     customer_name=customer_name,
                     year=year,
                     month=month,
-                    projects=group_projects
+                    projects=group_projects,
+                    invoice_date=invoice_date
                 )
                 invoices.append(invoice)
-                logger.info(f"グループ請求書を作成: {customer_name} {year}年{month}月 ({len(group_projects)}案件)")
+                logger.info(
+                    "グループ請求書を作成: %s %d年%d月 (%d案件)",
+                    customer_name, year, month, len(group_projects)
+                )
 
             except Exception as e:
                 error_msg = f"{customer_name} {year}年{month}月: {str(e)}"
                 errors.append(error_msg)
-                logger.warning(f"請求書作成をスキップ: {error_msg}")
+                logger.warning("請求書作成をスキップ: %s", error_msg)
                 if not skip_errors:
                     raise
 
-        logger.info(f"グループ変換完了: {len(invoices)}件成功, {len(errors)}件エラー")
+        logger.info("グループ変換完了: %d件成功, %d件エラー", len(invoices), len(errors))
         return invoices, errors
 
     def _create_grouped_invoice(
@@ -311,7 +423,9 @@ class InvoiceMapper:
         year: int,
         month: int,
         projects: list[TrainingProject],
-        payment_terms_days: int = 30
+        payment_terms_days: int = 30,
+        *,
+        invoice_date: Optional[date] = None
     ) -> Invoice:
         """グループ化された案件から請求書を作成
 
@@ -321,51 +435,59 @@ class InvoiceMapper:
             month: 月
             projects: 研修案件のリスト
             payment_terms_days: 支払期限日数（デフォルト: 30日）
+            invoice_date: 請求日（指定なしの場合は該当月の末日）
 
         Returns:
             請求書データ
         """
-        import calendar
-        from datetime import date as date_type, timedelta
-
         # 請求日は該当月の末日
-        _, last_day = calendar.monthrange(year, month)
-        invoice_date = date_type(year, month, last_day)
+        if invoice_date is None:
+            _, last_day = calendar.monthrange(year, month)
+            invoice_date = date(year, month, last_day)
 
         # 支払期限の計算
         due_date = invoice_date + timedelta(days=payment_terms_days)
 
+        # 実施期間は明細と備考の両方で使うため1回だけ整形
+        date_ranges = [project.format_date_range() for project in projects]
+
         # 明細行の作成（各案件を明細行として追加）
         items = []
-        for project in projects:
+        for project, date_range in zip(projects, date_ranges):
+            amount = _to_decimal(project.amount)
             item = InvoiceItem(
                 item_name=project.title,
                 quantity=1,
-                unit_price=Decimal(str(project.amount)),
-                amount=Decimal(str(project.amount)),
-                description=self._create_item_description(project),
+                unit_price=amount,
+                amount=amount,
+                description=self._create_item_description(project, date_range),
             )
             items.append(item)
 
         # 小計の計算
-        subtotal = sum(item.amount for item in items)
+        subtotal = Decimal(0)
+        for item in items:
+            subtotal += item.amount
 
         # 消費税の計算
-        tax_amount = (subtotal * self.tax_rate).quantize(Decimal("0"))
+        tax_amount = (subtotal * self.tax_rate).quantize(
+            TAX_QUANTIZE, rounding=ROUND_HALF_UP
+        )
 
         # 合計金額
         total_amount = subtotal + tax_amount
 
-        # 備考の作成
-        notes_parts = [
+        # 備考の作成（実施期間は明細作成時に整形したものを使う）
+        header = [
             f"{year}年{month}月分の研修案件（{len(projects)}件）",
             "",
             "案件一覧:",
         ]
-        for i, project in enumerate(projects, 1):
-            notes_parts.append(f"{i}. {project.title} ({project.format_date_range()})")
-
-        notes = "\n".join(notes_parts)
+        lines = [
+            f"{i}. {project.title} ({date_range})"
+            for i, (project, date_range) in enumerate(zip(projects, date_ranges), 1)
+        ]
+        notes = "\n".join(header + lines)
 
         # 顧客IDの取得（最初のプロジェクトから）
         customer_id = projects[0].customer_id if projects else None
@@ -376,8 +498,8 @@ class InvoiceMapper:
         # 案件IDリストを作成
         source_ids = [project.id for project in projects]
 
-        # 請求書作成
-        invoice = Invoice(
+        # 請求書作成（検証済みの値から組み立てるため、pydanticの検証を省略）
+        invoice = Invoice.model_construct(
             invoice_number=invoice_number,
             invoice_date=invoice_date,
             due_date=due_date,
@@ -394,3 +516,39 @@ class InvoiceMapper:
         )
 
         return invoice
+
+
+def _map_project(
+    mapper: InvoiceMapper,
+    project: TrainingProject
+) -> tuple[Optional[Invoice], Optional[DataValidationError]]:
+    """1件の研修案件を請求書に変換（プロセスプールから呼び出せるようモジュール関数）
+
+    Args:
+        mapper: マッパー
+        project: 研修案件データ
+
+    Returns:
+        (請求書, 検証エラー) のいずれか一方が設定されたタプル
+    """
+    try:
+        return mapper.map_to_invoice(project), None
+    except DataValidationError as e:
+        return None, e
+
+
+def _map_chunk(
+    tax_rate: str,
+    projects: list[TrainingProject]
+) -> list[tuple[Optional[Invoice], Optional[DataValidationError]]]:
+    """研修案件のチャンクを請求書に変換（プロセスプールから呼び出せるようモジュール関数）
+
+    Args:
+        tax_rate: 消費税率（文字列）
+        projects: 研修案件のリスト
+
+    Returns:
+        (請求書, 検証エラー) のリスト
+    """
+    mapper = InvoiceMapper(tax_rate=Decimal(tax_rate))
+    return [_map_project(mapper, project) for project in projects]
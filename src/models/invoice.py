@@ -1,26 +1,34 @@
 """請求書データモデル"""
+from dataclasses import dataclass
 from datetime import datetime, date
 from typing import Optional, List
-from decimal import Decimal
-from pydantic import BaseModel, Field, field_validator
+from decimal import ROUND_HALF_UP, Decimal
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# 消費税額の丸め単位（1円、四捨五入で使用）
+TAX_QUANTIZE = Decimal("1")
 
-class InvoiceItem(BaseModel):
-    """請求書明細行"""
 
-    item_name: str = Field(..., description="品目名")
-    quantity: int = Field(default=1, description="数量")
-    unit_price: Decimal = Field(..., description="単価")
-    amount: Decimal = Field(..., description="金額")
-    description: Optional[str] = Field(None, description="説明")
+@dataclass(slots=True, frozen=True, kw_only=True)
+class InvoiceItem:
+    """請求書明細行
 
-    @field_validator('amount')
-    @classmethod
-    def validate_amount(cls, v: Decimal, info) -> Decimal:
+    明細ごとに大量に生成されるため、pydanticモデルではなく軽量なdataclassとする
+    """
+
+    # Invoiceのjson_encoders（Decimal→float）を引き継がず、金額はDecimalの文字列表現で出力する
+    __pydantic_config__ = ConfigDict()
+
+    item_name: str  # 品目名
+    quantity: int = 1  # 数量
+    unit_price: Decimal  # 単価
+    amount: Decimal  # 金額
+    description: Optional[str] = None  # 説明
+
+    def __post_init__(self) -> None:
         """金額の検証"""
-        if v < 0:
+        if self.amount < 0:
             raise ValueError("金額は0以上である必要があります")
-        return v
 
 
 class Invoice(BaseModel):
@@ -67,9 +75,14 @@ class Invoice(BaseModel):
 
     def calculate_totals(self) -> None:
         """合計金額を再計算"""
-        self.subtotal = sum(item.amount for item in self.items)
-        self.tax_amount = (self.subtotal * self.tax_rate).quantize(Decimal("0"))
-        self.total_amount = self.subtotal + self.tax_amount
+        subtotal = Decimal(0)
+        for item in self.items:
+            subtotal += item.amount
+        self.subtotal = subtotal
+        self.tax_amount = (subtotal * self.tax_rate).quantize(
+            TAX_QUANTIZE, rounding=ROUND_HALF_UP
+        )
+        self.total_amount = subtotal + self.tax_amount
 
     def to_dict(self) -> dict:
         """辞書形式に変換"""
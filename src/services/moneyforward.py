@@ -1,25 +1,158 @@
 """MoneyForward API連携サービス"""
-from typing import Dict, Any, List, Optional
+# Perf profile:
+#   このモジュールの処理時間は invoice.moneyforward.com とのネットワーク往復が支配的で、
+#   Python側のCPU処理ではない。create_invoice は1件ごとにTLS越しのPOSTで
+#   数十〜数百ミリ秒ブロックする一方、InvoiceMapper.map_batch / map_grouped_invoices は
+#   1件あたり数マイクロ秒程度で終わる。
+#   そのため、マッパーのJIT化（NumbaはDecimal非対応）やSIMD化は効果がない。
+#   最適化の対象は、送受信バイト数・リクエスト数（バッチ化、コネクション再利用）、
+#   非同期HTTPによる待ち時間の重ね合わせ、およびオブジェクト生成のオーバーヘッドとする。
+import asyncio
+import gzip
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple, Union
 from decimal import Decimal
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..models.invoice import Invoice
 from ..utils.auth import MoneyForwardAuth
+from ..utils.config import config
 from ..utils.logger import setup_logger
 from ..utils.exceptions import MoneyForwardAPIError, AuthenticationError
 
 logger = setup_logger(__name__)
 
+# 明細の消費税区分（消費税10%）
+_EXCISE_10 = 'ten_percent'
+
+# Retry-After ヘッダーがない・解釈できない場合の待機秒数
+_DEFAULT_RETRY_AFTER = 1.0
+
+
+def _retry_after_seconds(headers: Mapping[str, str]) -> float:
+    """Retry-After ヘッダーから待機秒数を求める
+
+    異常に長い指定で処理が止まらないよう、MONEYFORWARD_MAX_RETRY_AFTER 秒を上限とする
+
+    Args:
+        headers: レスポンスヘッダー
+
+    Returns:
+        待機秒数
+    """
+    return min(_parse_retry_after(headers.get('Retry-After')), config.MONEYFORWARD_MAX_RETRY_AFTER)
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    """Retry-After ヘッダーの値（秒数またはHTTP日付）を秒数に変換"""
+    if not value:
+        return _DEFAULT_RETRY_AFTER
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # HTTP日付形式の場合
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return _DEFAULT_RETRY_AFTER
+
+
+class _CappedRetry(Retry):
+    """Retry-After の待機時間に上限を設けた urllib3 の再試行設定"""
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, config.MONEYFORWARD_MAX_RETRY_AFTER)
+
 
 class MoneyForwardService:
-    """MoneyForward API操作クライアント"""
+    """MoneyForward API操作クライアント
+
+    処理時間はAPIとの通信待ち（I/Oバウンド）が大半を占める。
+    性能改善はリクエスト数や通信量の削減を優先すること。
+    """
 
     API_BASE_URL = "https://invoice.moneyforward.com/api/v3"
 
+    # コネクションプール設定（並列作成時もTLS接続を使い回す）
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 32
+
+    # このサイズ（バイト）を超えるリクエストボディをgzip圧縮する
+    GZIP_MIN_SIZE = 2048
+
+    # 取引先検索で1回に取得する件数
+    PARTNERS_PER_PAGE = 100
+
     def __init__(self):
         """初期化"""
         self.auth = MoneyForwardAuth()
         self._access_token: Optional[str] = None
+        # 並列リクエスト時にトークン更新が重複しないよう排他制御
+        self._auth_lock = threading.Lock()
+        self._session = self._create_session()
+        # 取引先名 → 取引先IDのキャッシュ（初回参照時に一括取得）
+        # 取引先名 → 取引先ID（見つからなかった取引先はNone）
+        self._partner_cache: Dict[str, Optional[str]] = {}
+        self._partner_lock = threading.Lock()
+        # 直近のレスポンスで通知された残りリクエスト数（X-RateLimit-Remaining）
+        self._rl_remaining: Optional[int] = None
+
+    def _create_session(self) -> requests.Session:
+        """接続を再利用するHTTPセッションを作成
+
+        ステータスコードによる再試行はGETのみとする
+        （POSTを再送すると請求書が重複して作成される恐れがあるため）。
+        接続確立前のエラーはリクエスト未送信のためPOSTも再試行する。
+        429/503 の再試行では Retry-After ヘッダーの待機時間に従う（上限あり）。
+
+        Returns:
+            HTTPセッション
+        """
+        retry = _CappedRetry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        # 変化しないヘッダーはセッションに1度だけ設定
+        session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+        })
+        return session
+
+    def close(self) -> None:
+        """HTTPセッションを閉じる"""
+        self._session.close()
+        self.auth.close()
+
+    def __enter__(self) -> "MoneyForwardService":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def _ensure_authenticated(self) -> None:
         """認証済みかどうかを確認
@@ -27,7 +160,8 @@ class MoneyForwardService:
         Raises:
             AuthenticationError: 認証されていない場合
         """
-        self._access_token = self.auth.get_valid_token()
+        with self._auth_lock:
+            self._access_token = self.auth.get_valid_token()
         if not self._access_token:
             raise AuthenticationError(
                 "MoneyForwardに認証されていません。\n"
@@ -40,12 +174,29 @@ class MoneyForwardService:
         Returns:
             ヘッダー辞書
         """
+        # Content-Type / Accept はセッションに設定済み
         return {
             'Authorization': f'Bearer {self._access_token}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
         }
 
+    def _encode_body(self, data: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+        """リクエストボディをJSONにエンコード
+
+        orjsonでUTF-8のバイト列に直接変換する（日付はISO形式で出力される）。
+        MONEYFORWARD_GZIP_REQUESTS が有効な場合、GZIP_MIN_SIZE を超える
+        ボディはgzip圧縮する（圧縮率より速度を優先してレベル1とする）。
+
+        Args:
+            data: 送信するデータ
+
+        Returns:
+            (ボディ, 追加のリクエストヘッダー)
+        """
+        body = orjson.dumps(data)
+        if config.MONEYFORWARD_GZIP_REQUESTS and len(body) > self.GZIP_MIN_SIZE:
+            return gzip.compress(body, compresslevel=1), {'Content-Encoding': 'gzip'}
+        return body, {}
+
     def create_invoice(self, invoice: Invoice) -> Dict[str, Any]:
         """請求書を作成
 
@@ -64,14 +215,27 @@ class MoneyForwardService:
         invoice_data = self._convert_to_mf_format(invoice)
 
         url = f"{self.API_BASE_URL}/billings"
+        body, body_headers = self._encode_body(invoice_data)
+
+        headers = {**self._get_headers(), **body_headers}
 
         try:
             logger.info(f"請求書を作成中: {invoice.project_name}")
-            response = requests.post(
-                url,
-                json=invoice_data,
-                headers=self._get_headers()
-            )
+            delay = self._rate_limit_delay()
+            if delay:
+                time.sleep(delay)
+            response = self._session.post(url, data=body, headers=headers)
+            self._record_rate_limit(response)
+
+            # レート制限に達した場合は指定時間待って1回だけ再送する
+            # （429は処理されていないため、再送しても請求書は重複しない）
+            if response.status_code == 429:
+                wait = _retry_after_seconds(response.headers)
+                logger.warning(f"レート制限に達しました。{wait:.1f}秒後に再試行します")
+                time.sleep(wait)
+                response = self._session.post(url, data=body, headers=headers)
+                self._record_rate_limit(response)
+
             response.raise_for_status()
 
             result = response.json()
@@ -87,6 +251,127 @@ class MoneyForwardService:
             logger.error(f"API呼び出しエラー: {e}")
             raise MoneyForwardAPIError(f"API呼び出しに失敗しました: {e}")
 
+    async def create_invoices_bulk(
+        self,
+        invoices: List[Invoice],
+        concurrency: int = 8
+    ) -> List[Union[Dict[str, Any], MoneyForwardAPIError]]:
+        """複数の請求書を並行して作成
+
+        HTTP/2で最大 concurrency 件のPOSTを同時に送信し、通信待ちを重ね合わせる。
+        レート制限（429）の場合は create_invoice と同様に Retry-After だけ待って1回だけ再送する。
+        残りリクエスト数が0と通知されている間は、送信前に待機する。
+        1件の失敗で全体を中断せず、失敗した請求書の位置には例外を格納して返す。
+
+        Args:
+            invoices: 請求書データのリスト
+            concurrency: 同時に送信するリクエスト数の上限
+
+        Returns:
+            invoices と同じ順序の結果リスト
+            （成功時はレスポンス、失敗時は MoneyForwardAPIError）
+
+        Raises:
+            AuthenticationError: 認証されていない場合
+        """
+        # トークン更新は同期通信のため、イベントループを止めないようスレッドで実行する
+        await asyncio.to_thread(self._ensure_authenticated)
+
+        url = f"{self.API_BASE_URL}/billings"
+        semaphore = asyncio.Semaphore(concurrency)
+        headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            **self._get_headers(),
+        }
+
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=concurrency),
+            headers=headers,
+        ) as client:
+
+            async def post(invoice: Invoice) -> Dict[str, Any]:
+                # 変換時の取引先の検索は同期通信のためスレッドで実行する
+                invoice_data = await asyncio.to_thread(self._convert_to_mf_format, invoice)
+                body, body_headers = self._encode_body(invoice_data)
+                async with semaphore:
+                    logger.info(f"請求書を作成中: {invoice.project_name}")
+                    delay = self._rate_limit_delay()
+                    if delay:
+                        await asyncio.sleep(delay)
+                    response = await client.post(
+                        url,
+                        content=body,
+                        headers=body_headers
+                    )
+                    self._record_rate_limit(response)
+
+                    # 429は処理されていないため、再送しても請求書は重複しない
+                    if response.status_code == 429:
+                        wait = _retry_after_seconds(response.headers)
+                        logger.warning(
+                            f"レート制限に達しました。{wait:.1f}秒後に再試行します: {invoice.project_name}"
+                        )
+                        await asyncio.sleep(wait)
+                        response = await client.post(
+                            url,
+                            content=body,
+                            headers=body_headers
+                        )
+                        self._record_rate_limit(response)
+
+                    response.raise_for_status()
+                    result = response.json()
+                    logger.info(f"請求書を作成しました: ID={result.get('id')}")
+                    return result
+
+            responses = await asyncio.gather(
+                *(post(invoice) for invoice in invoices),
+                return_exceptions=True
+            )
+
+        results: List[Union[Dict[str, Any], MoneyForwardAPIError]] = []
+        for invoice, response in zip(invoices, responses):
+            if isinstance(response, httpx.HTTPStatusError):
+                error_msg = self._extract_error_message(response.response)
+                logger.error(f"請求書作成エラー: {invoice.project_name} - {error_msg}")
+                response = MoneyForwardAPIError(f"請求書作成に失敗しました: {error_msg}")
+            elif isinstance(response, Exception):
+                logger.error(f"API呼び出しエラー: {invoice.project_name} - {response}")
+                response = MoneyForwardAPIError(f"API呼び出しに失敗しました: {response}")
+            results.append(response)
+
+        return results
+
+    def _record_rate_limit(
+        self,
+        response: Union[requests.Response, httpx.Response]
+    ) -> None:
+        """レスポンスの X-RateLimit-Remaining を記録
+
+        Args:
+            response: レスポンスオブジェクト
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is not None:
+            try:
+                self._rl_remaining = int(remaining)
+            except ValueError:
+                pass
+
+    def _rate_limit_delay(self) -> float:
+        """次の請求書作成の前に待機する秒数
+
+        直近のレスポンスで残りリクエスト数が0と通知されていれば、429を受ける前に待機する
+
+        Returns:
+            待機秒数（待機不要の場合は0）
+        """
+        if self._rl_remaining is not None and self._rl_remaining <= 0:
+            return _DEFAULT_RETRY_AFTER
+        return 0.0
+
     def get_invoice(self, invoice_id: str) -> Dict[str, Any]:
         """請求書を取得
 
@@ -104,7 +389,7 @@ class MoneyForwardService:
         url = f"{self.API_BASE_URL}/billings/{invoice_id}"
 
         try:
-            response = requests.get(url, headers=self._get_headers())
+            response = self._session.get(url, headers=self._get_headers())
             response.raise_for_status()
             return response.json()
 
@@ -117,7 +402,9 @@ class MoneyForwardService:
         page: int = 1,
         per_page: int = 100
     ) -> List[Dict[str, Any]]:
-        """請求書一覧を取得
+        """請求書一覧を取得（1ページ分）
+
+        全件を順に処理する場合は iter_invoices を使用する
 
         Args:
             page: ページ番号
@@ -138,7 +425,7 @@ class MoneyForwardService:
         }
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
                 params=params,
                 headers=self._get_headers()
@@ -151,6 +438,29 @@ class MoneyForwardService:
             logger.error(f"請求書一覧取得エラー: {e}")
             raise MoneyForwardAPIError(f"請求書一覧取得に失敗しました: {e}")
 
+    def iter_invoices(self, per_page: int = 100) -> Iterator[Dict[str, Any]]:
+        """全ての請求書を1ページずつ取得しながら1件ずつ返す
+
+        一覧全体をメモリに保持しないため、件数が多い場合に使用する
+
+        Args:
+            per_page: 1ページあたりの件数
+
+        Yields:
+            請求書データ
+
+        Raises:
+            MoneyForwardAPIError: API呼び出しに失敗した場合
+        """
+        page = 1
+        while True:
+            data = self.list_invoices(page=page, per_page=per_page)
+            yield from data
+
+            if len(data) < per_page:
+                return
+            page += 1
+
     def _convert_to_mf_format(self, invoice: Invoice) -> Dict[str, Any]:
         """InvoiceオブジェクトをMoneyForward API形式に変換
 
@@ -161,21 +471,22 @@ class MoneyForwardService:
             MoneyForward API形式の辞書
         """
         # 明細行を変換
-        items = []
-        for item in invoice.items:
-            items.append({
+        items = [
+            {
                 'name': item.item_name,
                 'quantity': item.quantity,
                 'unit_price': float(item.unit_price),
                 'description': item.description or '',
-                'excise': 'ten_percent',  # 消費税10%
-            })
+                'excise': _EXCISE_10,
+            }
+            for item in invoice.items
+        ]
 
         # 請求書データを構築
         billing_data = {
             'billing': {
-                'billing_date': invoice.invoice_date.isoformat(),
-                'due_date': invoice.due_date.isoformat() if invoice.due_date else None,
+                'billing_date': invoice.invoice_date,
+                'due_date': invoice.due_date,
                 'billing_number': invoice.invoice_number or '',
                 'note': invoice.notes or '',
                 'items': items,
@@ -184,11 +495,71 @@ class MoneyForwardService:
 
         # 顧客情報（必要に応じて追加）
         if invoice.customer_name and invoice.customer_name != "顧客名未設定":
-            billing_data['billing']['partner_name'] = invoice.customer_name
+            partner_id = self._get_partner_id(invoice.customer_name)
+            if partner_id:
+                billing_data['billing']['partner_id'] = partner_id
+            else:
+                billing_data['billing']['partner_name'] = invoice.customer_name
 
         return billing_data
 
-    def _extract_error_message(self, response: requests.Response) -> str:
+    def _get_partner_id(self, name: str) -> Optional[str]:
+        """取引先名から取引先IDを取得
+
+        取引先名ごとに初回だけ /partners を検索し、結果（見つからなかった場合も含む）をキャッシュする。
+        検索に失敗した場合はキャッシュせず、取引先名での指定に切り替える。
+
+        Args:
+            name: 取引先名
+
+        Returns:
+            取引先ID（見つからない場合はNone）
+        """
+        if name in self._partner_cache:
+            return self._partner_cache[name]
+
+        # 並列に作成する場合も同じ取引先を重複して検索しない
+        with self._partner_lock:
+            if name in self._partner_cache:
+                return self._partner_cache[name]
+
+            try:
+                partner_id = self._find_partner_id(name)
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"取引先の検索に失敗しました（取引先名で指定します）: {name} - {e}")
+                return None
+
+            self._partner_cache[name] = partner_id
+            return partner_id
+
+    def _find_partner_id(self, name: str) -> Optional[str]:
+        """取引先名で /partners を検索し、名前が完全一致する取引先のIDを返す
+
+        Args:
+            name: 取引先名
+
+        Returns:
+            取引先ID（見つからない場合はNone）
+
+        Raises:
+            requests.exceptions.RequestException: API呼び出しに失敗した場合
+        """
+        response = self._session.get(
+            f"{self.API_BASE_URL}/partners",
+            params={'q': name, 'per_page': self.PARTNERS_PER_PAGE},
+            headers=self._get_headers()
+        )
+        response.raise_for_status()
+
+        for partner in response.json().get('data', []):
+            if partner.get('name') == name and partner.get('id'):
+                return partner['id']
+        return None
+
+    def _extract_error_message(
+        self,
+        response: Union[requests.Response, httpx.Response]
+    ) -> str:
         """エラーレスポンスからメッセージを抽出
 
         Args:
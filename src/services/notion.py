@@ -1,25 +1,100 @@
 """Notion API連携サービス"""
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Dict, Any
+import httpx
 from notion_client import Client
 from ..models.training_project import TrainingProject
 from ..utils.config import config
 from ..utils.logger import setup_logger
 from ..utils.exceptions import NotionAPIError
+from ..utils.rate_limiter import RateLimiter
+from . import notion_parser
 
 logger = setup_logger(__name__)
 
+# クエリ結果として取得するプロパティ（_parse_page で参照するもの）
+QUERY_PROPERTIES = notion_parser.PROPERTY_NAMES
+
+# 検索条件の引数名 → Notionクエリのフィルタ条件を組み立てる関数
+_FILTER_BUILDERS = {
+    "status_filter": lambda v: {"property": "ステータス", "status": {"equals": v}},
+    "start_date_from": lambda v: {"property": "開始", "date": {"on_or_after": v}},
+    "start_date_to": lambda v: {"property": "開始", "date": {"on_or_before": v}},
+    "amount_min": lambda v: {"property": "金額", "number": {"greater_than_or_equal_to": v}},
+    "amount_max": lambda v: {"property": "金額", "number": {"less_than_or_equal_to": v}},
+}
+
+
+def _build_query_filter(criteria: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """検索条件からNotionクエリのフィルタを構築
+
+    Args:
+        criteria: 引数名 → 値（None・空文字は未指定として扱う）
+
+    Returns:
+        フィルタ（条件がない場合はNone、複数の場合はandで結合）
+    """
+    filters = [
+        _FILTER_BUILDERS[key](value)
+        for key, value in criteria.items()
+        if value is not None and value != ""
+    ]
+    if not filters:
+        return None
+    if len(filters) == 1:
+        return filters[0]
+    return {"and": filters}
+
 
 class NotionService:
     """Notion API操作クラス"""
 
+    # 請求済みフラグ更新の並列数
+    UPDATE_WORKERS = 5
+
+    # 顧客名取得の並列数
+    CUSTOMER_WORKERS = 3
+
+    # 顧客マスタを全件取得する、未取得の顧客数の下限
+    # 全件取得は100件ごとに1リクエストかかるため、個別取得のリクエスト数が
+    # マスタのページ数（1,000件規模のマスタで10リクエスト）を上回る場合のみ行う
+    CUSTOMER_DB_MIN_IDS = 10
+
+    # Notion API接続の上限（並列取得・更新のワーカー数を賄える数を保持する）
+    HTTP_MAX_CONNECTIONS = 10
+    HTTP_MAX_KEEPALIVE = 5
+
     def __init__(self):
         """初期化"""
         if not config.NOTION_API_KEY:
             raise NotionAPIError("NOTION_API_KEY が設定されていません")
 
-        self.client = Client(auth=config.NOTION_API_KEY)
+        # HTTP/2で1本の接続に多重化し、接続を使い回すHTTPクライアントを渡す
+        # （ベースURL・タイムアウト・認証ヘッダーは notion_client 側で設定される）
+        self._http = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=self.HTTP_MAX_KEEPALIVE,
+            ),
+        )
+        self.client = Client(auth=config.NOTION_API_KEY, client=self._http)
         self.database_id = config.NOTION_DATABASE_ID
+        self._limiter = RateLimiter(config.NOTION_RATE_LIMIT)
+        self._property_ids: Optional[List[str]] = None
+        # 顧客ID → 顧客名のキャッシュ（同じ顧客への再取得を省略）
+        self._customer_cache: Dict[str, Optional[str]] = {}
+        self._customer_db_loaded = False
+
+    def close(self) -> None:
+        """HTTPクライアントを閉じる"""
+        self._http.close()
+
+    def __enter__(self) -> "NotionService":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def fetch_training_projects(
         self,
@@ -43,90 +118,116 @@ class NotionService:
         Returns:
             研修案件のリスト
         """
+        return list(self.iter_training_projects(
+            status_filter=status_filter,
+            limit=limit,
+            start_date_from=start_date_from,
+            start_date_to=start_date_to,
+            amount_min=amount_min,
+            amount_max=amount_max,
+        ))
+
+    def iter_training_projects(
+        self,
+        status_filter: Optional[str] = None,
+        limit: Optional[int] = None,
+        start_date_from: Optional[str] = None,
+        start_date_to: Optional[str] = None,
+        amount_min: Optional[float] = None,
+        amount_max: Optional[float] = None
+    ) -> Iterator[TrainingProject]:
+        """研修案件をページ単位で取得しながら1件ずつ返す
+
+        全件をメモリに保持せず、Notionのページネーションに沿って順次取得する
+
+        Args:
+            status_filter: ステータスでフィルタ（受注/実施中/完了）
+            limit: 取得件数の上限
+            start_date_from: 開始日の下限 (YYYY-MM-DD)
+            start_date_to: 開始日の上限 (YYYY-MM-DD)
+            amount_min: 金額の下限
+            amount_max: 金額の上限
+
+        Yields:
+            研修案件
+        """
         try:
             logger.info(f"Notionデータベースから研修案件を取得中... (DB: {self.database_id})")
 
             # クエリ条件を構築
             query_params: Dict[str, Any] = {}
-            filters = []
-
-            # ステータスフィルタ
-            if status_filter:
-                filters.append({
-                    "property": "ステータス",
-                    "status": {
-                        "equals": status_filter
-                    }
-                })
-
-            # 開始日フィルタ
-            if start_date_from:
-                filters.append({
-                    "property": "開始",
-                    "date": {
-                        "on_or_after": start_date_from
-                    }
-                })
-
-            if start_date_to:
-                filters.append({
-                    "property": "開始",
-                    "date": {
-                        "on_or_before": start_date_to
-                    }
-                })
-
-            # 金額フィルタ
-            if amount_min is not None:
-                filters.append({
-                    "property": "金額",
-                    "number": {
-                        "greater_than_or_equal_to": amount_min
-                    }
-                })
-
-            if amount_max is not None:
-                filters.append({
-                    "property": "金額",
-                    "number": {
-                        "less_than_or_equal_to": amount_max
-                    }
-                })
-
-            # フィルタを結合
-            if filters:
-                if len(filters) == 1:
-                    query_params["filter"] = filters[0]
-                else:
-                    query_params["filter"] = {
-                        "and": filters
-                    }
-
-            if limit:
-                query_params["page_size"] = min(limit, 100)
-
-            # データベースをクエリ
-            response = self.client.databases.query(
-                database_id=self.database_id,
-                **query_params
-            )
-
-            projects = []
-            for page in response.get("results", []):
-                try:
-                    project = self._parse_page(page)
-                    projects.append(project)
-                except Exception as e:
-                    logger.warning(f"ページの解析に失敗: {page.get('id')} - {e}")
-                    continue
-
-            logger.info(f"{len(projects)}件の研修案件を取得しました")
-            return projects
+            query_filter = _build_query_filter({
+                "status_filter": status_filter,
+                "start_date_from": start_date_from,
+                "start_date_to": start_date_to,
+                "amount_min": amount_min,
+                "amount_max": amount_max,
+            })
+            if query_filter:
+                query_params["filter"] = query_filter
+
+            # 必要なプロパティのみ返すよう指定
+            property_ids = self._get_property_ids()
+            if property_ids:
+                query_params["filter_properties"] = property_ids
+
+            count = 0
+            while True:
+                query_params["page_size"] = min(limit - count, 100) if limit else 100
+
+                # データベースをクエリ
+                response = self.client.databases.query(
+                    database_id=self.database_id,
+                    **query_params
+                )
+
+                projects = []
+                for page in response.get("results") or ():
+                    try:
+                        projects.append(self._parse_page(page))
+                    except Exception as e:
+                        logger.warning(f"ページの解析に失敗: {page.get('id')} - {e}")
+                        continue
+
+                # ページ内の顧客名をまとめて取得してから返す
+                self._fill_customer_names(projects)
+
+                for project in projects:
+                    yield project
+                    count += 1
+
+                # 上限に達したか、次のページがなければ終了
+                if (limit and count >= limit) or not response.get("has_more"):
+                    break
+                query_params["start_cursor"] = response.get("next_cursor")
+
+            logger.info(f"{count}件の研修案件を取得しました")
 
         except Exception as e:
             logger.error(f"Notion APIエラー: {e}")
             raise NotionAPIError(f"データ取得に失敗しました: {e}")
 
+    def _get_property_ids(self) -> List[str]:
+        """クエリで取得するプロパティのIDを取得
+
+        Returns:
+            プロパティIDのリスト（取得できない場合は空リスト）
+        """
+        if self._property_ids is None:
+            try:
+                database = self.client.databases.retrieve(database_id=self.database_id)
+                properties = database.get("properties", {})
+                self._property_ids = [
+                    properties[name]["id"]
+                    for name in QUERY_PROPERTIES
+                    if name in properties
+                ]
+            except Exception as e:
+                logger.warning(f"データベースのプロパティ情報の取得に失敗: {e}")
+                self._property_ids = []
+
+        return self._property_ids
+
     def _parse_page(self, page: Dict[str, Any]) -> TrainingProject:
         """NotionページをTrainingProjectに変換
 
@@ -136,165 +237,136 @@ class NotionService:
         Returns:
             TrainingProject
         """
-        props = page.get("properties", {})
-
-        # タイトル取得
-        title_prop = props.get("案件名", {})
-        title = self._extract_title(title_prop)
-
-        # ステータス取得
-        status_prop = props.get("ステータス", {})
-        status = self._extract_status(status_prop)
-
-        # 日付取得
-        start_prop = props.get("開始", {})
-        end_prop = props.get("終了", {})
-        start_date = self._extract_date(start_prop)
-        end_date = self._extract_date(end_prop)
-
-        # 顧客名取得（Relation）
-        customer_prop = props.get("顧客名", {})
-        customer_name, customer_id = self._extract_relation(customer_prop)
-
-        # 金額取得
-        amount_prop = props.get("金額", {})
-        amount = self._extract_number(amount_prop)
-
-        # その他の数値
-        unit_price = self._extract_number(props.get("単価", {}))
-        participants = self._extract_number(props.get("参加人数", {}))
-        days = self._extract_number(props.get("日数", {}))
-
-        # テキスト情報
-        location = self._extract_text(props.get("研修場所", {}))
-        format_type = self._extract_select(props.get("研修形式", {}))
-        notes = self._extract_text(props.get("備考", {}))
-
-        # メタ情報
-        created_time = page.get("created_time")
-        last_edited_time = page.get("last_edited_time")
-
-        # 請求済みフラグ
-        invoiced_prop = props.get("請求済み", {})
-        invoiced = self._extract_checkbox(invoiced_prop)
-
-        return TrainingProject(
-            id=page["id"],
-            title=title,
-            status=status,
-            start_date=self._parse_datetime(start_date) if start_date else None,
-            end_date=self._parse_datetime(end_date) if end_date else None,
-            customer_name=customer_name,
-            customer_id=customer_id,
-            amount=amount,
-            unit_price=unit_price,
-            participants=int(participants) if participants else None,
-            days=int(days) if days else None,
-            location=location,
-            format=format_type,
-            notes=notes,
-            created_time=self._parse_datetime(created_time) if created_time else None,
-            last_edited_time=self._parse_datetime(last_edited_time) if last_edited_time else None,
-            invoiced=invoiced,
-        )
-
-    def _extract_title(self, prop: Dict[str, Any]) -> str:
-        """タイトルプロパティから値を抽出"""
-        if prop.get("type") == "title":
-            title_items = prop.get("title", [])
-            if title_items:
-                return "".join([item.get("plain_text", "") for item in title_items])
-        return "無題"
-
-    def _extract_status(self, prop: Dict[str, Any]) -> Optional[str]:
-        """ステータスプロパティから値を抽出"""
-        if prop.get("type") == "status":
-            status_obj = prop.get("status")
-            if status_obj:
-                return status_obj.get("name")
-        return None
-
-    def _extract_date(self, prop: Dict[str, Any]) -> Optional[str]:
-        """日付プロパティから値を抽出"""
-        if prop.get("type") == "date":
-            date_obj = prop.get("date")
-            if date_obj:
-                return date_obj.get("start")
-        return None
+        return notion_parser.parse_page(page)
 
-    def _extract_relation(self, prop: Dict[str, Any]) -> tuple[Optional[str], Optional[str]]:
-        """リレーションプロパティから値を抽出（名前とIDのタプル）"""
-        if prop.get("type") == "relation":
-            relations = prop.get("relation", [])
-            if relations:
-                # 最初のリレーションのIDを取得
-                relation_id = relations[0].get("id")
-                # TODO: 実際の顧客名を取得するには、関連ページを取得する必要がある
-                # 今は簡易実装として、IDのみ保存
-                return None, relation_id
-        return None, None
-
-    def _extract_number(self, prop: Dict[str, Any]) -> Optional[float]:
-        """数値プロパティから値を抽出"""
-        if prop.get("type") == "number":
-            return prop.get("number")
-        return None
+    def fetch_customer_name(self, customer_id: str) -> Optional[str]:
+        """顧客IDから顧客名を取得
 
-    def _extract_text(self, prop: Dict[str, Any]) -> Optional[str]:
-        """テキストプロパティから値を抽出"""
-        if prop.get("type") == "rich_text":
-            texts = prop.get("rich_text", [])
-            if texts:
-                return "".join([item.get("plain_text", "") for item in texts])
-        return None
+        取得済みの顧客はキャッシュから返す（取得に失敗した場合はキャッシュしない）
 
-    def _extract_select(self, prop: Dict[str, Any]) -> Optional[str]:
-        """セレクトプロパティから値を抽出"""
-        if prop.get("type") == "select":
-            select_obj = prop.get("select")
-            if select_obj:
-                return select_obj.get("name")
-        return None
+        Args:
+            customer_id: 顧客ページのID
 
-    def _extract_checkbox(self, prop: Dict[str, Any]) -> Optional[bool]:
-        """チェックボックスプロパティから値を抽出"""
-        if prop.get("type") == "checkbox":
-            return prop.get("checkbox", False)
-        return None
+        Returns:
+            顧客名
+        """
+        if customer_id in self._customer_cache:
+            return self._customer_cache[customer_id]
 
-    def _parse_datetime(self, dt_str: str) -> datetime:
-        """ISO8601形式の日時文字列をdatetimeに変換"""
         try:
-            # ISO8601形式をパース
-            return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+            page = self.client.pages.retrieve(page_id=customer_id)
         except Exception as e:
-            logger.warning(f"日時のパースに失敗: {dt_str} - {e}")
-            return datetime.now()
+            logger.warning(f"顧客名の取得に失敗: {customer_id} - {e}")
+            return None
 
-    def fetch_customer_name(self, customer_id: str) -> Optional[str]:
-        """顧客IDから顧客名を取得
+        name = notion_parser.extract_page_title(page)
+        self._customer_cache[customer_id] = name
+        return name
+
+    def fetch_customer_names(self, customer_ids: List[str]) -> Dict[str, Optional[str]]:
+        """複数の顧客IDから顧客名を並列に取得
 
         Args:
-            customer_id: 顧客ページのID
+            customer_ids: 顧客ページのIDのリスト（重複可）
 
         Returns:
-            顧客名
+            顧客ID → 顧客名の辞書
         """
+        unique_ids = list(dict.fromkeys(customer_id for customer_id in customer_ids if customer_id))
+
+        # キャッシュ済みの顧客は取得しない
+        names = {
+            customer_id: self._customer_cache[customer_id]
+            for customer_id in unique_ids
+            if customer_id in self._customer_cache
+        }
+        unique_ids = [customer_id for customer_id in unique_ids if customer_id not in names]
+        if not unique_ids:
+            return names
+
+        def fetch(customer_id: str) -> Optional[str]:
+            self._limiter.wait()
+            return self.fetch_customer_name(customer_id)
+
+        # 顧客ごとのページ取得はレート制限内で並列に行う
+        workers = min(self.CUSTOMER_WORKERS, len(unique_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            names.update(zip(unique_ids, executor.map(fetch, unique_ids)))
+
+        return names
+
+    def fetch_customers_bulk(self, customer_ids: List[str]) -> Dict[str, Optional[str]]:
+        """複数の顧客IDから顧客名をまとめて取得
+
+        顧客マスタのデータベース（NOTION_CUSTOMER_DATABASE_ID）が設定されていて、
+        未取得の顧客が CUSTOMER_DB_MIN_IDS 件を超える場合は、データベース全体を1度だけ
+        クエリして顧客名をキャッシュする（100件ごとに1リクエスト）。
+        それ以外の場合やマスタにない顧客は、顧客ページを個別に取得する。
+
+        Args:
+            customer_ids: 顧客ページのIDのリスト（重複可）
+
+        Returns:
+            顧客ID → 顧客名の辞書
+        """
+        if config.NOTION_CUSTOMER_DATABASE_ID and not self._customer_db_loaded:
+            uncached = {
+                customer_id for customer_id in customer_ids
+                if customer_id and customer_id not in self._customer_cache
+            }
+            if len(uncached) > self.CUSTOMER_DB_MIN_IDS:
+                self._load_customer_database(config.NOTION_CUSTOMER_DATABASE_ID)
+
+        return self.fetch_customer_names(customer_ids)
+
+    def _load_customer_database(self, database_id: str) -> None:
+        """顧客マスタのデータベースを全件取得して顧客名をキャッシュ
+
+        Args:
+            database_id: 顧客マスタのデータベースID
+        """
+        # 失敗した場合も再試行せず、個別取得に切り替える
+        self._customer_db_loaded = True
+
+        query_params: Dict[str, Any] = {"page_size": 100}
+        count = 0
         try:
-            page = self.client.pages.retrieve(page_id=customer_id)
-            props = page.get("properties", {})
+            while True:
+                self._limiter.wait()
+                response = self.client.databases.query(
+                    database_id=database_id,
+                    **query_params
+                )
 
-            # 顧客マスタのタイトルを取得
-            # プロパティ名は実際のデータベース構造に応じて調整が必要
-            for key, value in props.items():
-                if value.get("type") == "title":
-                    return self._extract_title(value)
+                for page in response.get("results") or ():
+                    self._customer_cache[page["id"]] = notion_parser.extract_page_title(page)
+                    count += 1
 
-            return None
+                if not response.get("has_more"):
+                    break
+                query_params["start_cursor"] = response.get("next_cursor")
+
+            logger.info(f"顧客マスタから{count}件の顧客を取得しました")
 
         except Exception as e:
-            logger.warning(f"顧客名の取得に失敗: {customer_id} - {e}")
-            return None
+            logger.warning(f"顧客マスタの取得に失敗（顧客ごとに取得します）: {e}")
+
+    def _fill_customer_names(self, projects: List[TrainingProject]) -> None:
+        """顧客名が未設定の案件に、リレーション先の顧客名を補完
+
+        Args:
+            projects: 研修案件のリスト
+        """
+        targets = [
+            project for project in projects
+            if project.customer_name is None and project.customer_id
+        ]
+        if not targets:
+            return
+
+        names = self.fetch_customers_bulk([project.customer_id for project in targets])
+        for project in targets:
+            project.customer_name = names.get(project.customer_id)
 
     def update_invoiced_status(self, page_id: str, invoiced: bool = True) -> bool:
         """研修案件の請求済みステータスを更新
@@ -331,14 +403,16 @@ class NotionService:
         Returns:
             (成功件数, 失敗件数)
         """
-        success_count = 0
-        failed_count = 0
-
-        for project_id in project_ids:
-            if self.update_invoiced_status(project_id, True):
-                success_count += 1
-            else:
-                failed_count += 1
+        def update(project_id: str) -> bool:
+            self._limiter.wait()
+            return self.update_invoiced_status(project_id, True)
+
+        # Notionには一括更新APIがないため、レート制限内で並列に更新
+        with ThreadPoolExecutor(max_workers=self.UPDATE_WORKERS) as executor:
+            results = list(executor.map(update, project_ids))
+
+        success_count = sum(results)
+        failed_count = len(results) - success_count
 
         logger.info(f"請求済みマーク完了: 成功{success_count}件, 失敗{failed_count}件")
         return success_count, failed_count
@@ -0,0 +1,210 @@
+"""Notion APIレスポンスの解析処理
+
+NotionService から呼び出す、ページデータをモデルに変換する純粋関数群
+"""
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+from ..models.training_project import TrainingProject
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 存在しないプロパティの代わりに渡す空の辞書（呼び出しごとの生成を避ける）
+# 読み取り専用にして、誤って書き込まれて共有状態が壊れることを防ぐ
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def parse_page(page: Dict[str, Any]) -> TrainingProject:
+    """NotionページをTrainingProjectに変換
+
+    Args:
+        page: Notion APIから返されたページデータ
+
+    Returns:
+        TrainingProject
+    """
+    props = page.get("properties", _EMPTY)
+
+    # ページのプロパティを1度だけ走査し、型ごとの抽出関数で値を取り出す
+    # （定義表にないプロパティ・型が異なるプロパティは既定値のまま。変換関数は値がある場合のみ適用）
+    fields = dict(_DEFAULT_FIELDS)
+    for key, prop in props.items():
+        spec = _FIELDS_BY_NAME.get(key)
+        if spec is None or not prop:
+            continue
+        prop_type, attr, coerce = spec
+        if prop.get("type") != prop_type:
+            continue
+        value = _EXTRACTORS[prop_type](prop)
+        if coerce is not None:
+            value = coerce(value) if value else None
+        fields[attr] = value
+
+    # 顧客名取得（Relation）
+    customer_name, customer_id = extract_relation(props.get("顧客名") or _EMPTY)
+
+    # メタ情報
+    created_time = page.get("created_time")
+    last_edited_time = page.get("last_edited_time")
+
+    return TrainingProject(
+        id=page["id"],
+        customer_name=customer_name,
+        customer_id=customer_id,
+        created_time=parse_datetime(created_time) if created_time else None,
+        last_edited_time=parse_datetime(last_edited_time) if last_edited_time else None,
+        **fields,
+    )
+
+
+def extract_page_title(page: Dict[str, Any]) -> Optional[str]:
+    """ページのタイトルプロパティから値を抽出（顧客マスタなど）
+
+    Args:
+        page: Notion APIから返されたページデータ
+
+    Returns:
+        タイトル（タイトルプロパティがない場合はNone）
+    """
+    # プロパティ名は実際のデータベース構造に応じて調整が必要なため、型で判定する
+    for value in page.get("properties", _EMPTY).values():
+        if value.get("type") == "title":
+            return extract_title(value)
+    return None
+
+
+def extract_title(prop: Mapping[str, Any]) -> str:
+    """タイトルプロパティから値を抽出"""
+    if prop.get("type") == "title":
+        return _title_value(prop)
+    return _MISSING_VALUES["title"]
+
+
+def extract_relation(prop: Mapping[str, Any]) -> tuple[Optional[str], Optional[str]]:
+    """リレーションプロパティから値を抽出（名前とIDのタプル）"""
+    if prop.get("type") == "relation":
+        relations = prop.get("relation") or ()
+        if relations:
+            # 最初のリレーションのIDを取得
+            # 顧客名は関連ページの取得が必要なため、NotionService._fill_customer_names でまとめて補完する
+            relation_id = relations[0].get("id")
+            return None, relation_id
+    return None, None
+
+
+# 以下の _*_value は型を確認済みのプロパティから値を取り出す
+
+def _title_value(prop: Mapping[str, Any]) -> str:
+    title_items = prop.get("title") or ()
+    # 通常は1要素のため、結合せずにそのまま返す
+    if len(title_items) == 1:
+        return title_items[0].get("plain_text", "")
+    if title_items:
+        return "".join(item.get("plain_text", "") for item in title_items)
+    return "無題"
+
+
+def _status_value(prop: Mapping[str, Any]) -> Optional[str]:
+    status_obj = prop.get("status")
+    return status_obj.get("name") if status_obj else None
+
+
+def _date_value(prop: Mapping[str, Any]) -> Optional[str]:
+    date_obj = prop.get("date")
+    return date_obj.get("start") if date_obj else None
+
+
+def _number_value(prop: Mapping[str, Any]) -> Optional[float]:
+    return prop.get("number")
+
+
+def _text_value(prop: Mapping[str, Any]) -> Optional[str]:
+    texts = prop.get("rich_text") or ()
+    if len(texts) == 1:
+        return texts[0].get("plain_text", "")
+    if texts:
+        return "".join(item.get("plain_text", "") for item in texts)
+    return None
+
+
+def _select_value(prop: Mapping[str, Any]) -> Optional[str]:
+    select_obj = prop.get("select")
+    return select_obj.get("name") if select_obj else None
+
+
+def _checkbox_value(prop: Mapping[str, Any]) -> bool:
+    return prop.get("checkbox", False)
+
+
+# Notionのプロパティ型 → 値の抽出関数
+_EXTRACTORS = {
+    "title": _title_value,
+    "status": _status_value,
+    "date": _date_value,
+    "number": _number_value,
+    "rich_text": _text_value,
+    "select": _select_value,
+    "checkbox": _checkbox_value,
+}
+
+# プロパティがない・型が異なる場合の値（記載のない型はNone）
+_MISSING_VALUES = {"title": "無題"}
+
+
+def parse_datetime(dt_str: str) -> datetime:
+    """ISO8601形式の日時文字列をdatetimeに変換"""
+    try:
+        # ISO8601形式をパース
+        return _parse_iso(dt_str)
+    except Exception as e:
+        logger.warning(f"日時のパースに失敗: {dt_str} - {e}")
+        return datetime.now()
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(dt_str: str) -> datetime:
+    """Notionが返すISO8601形式の日時文字列をdatetimeに変換（結果をキャッシュ）
+
+    Args:
+        dt_str: 日付（YYYY-MM-DD）または日時の文字列
+
+    Returns:
+        datetime
+    """
+    # 日付のみの場合は汎用パーサーを通さずに組み立てる
+    if len(dt_str) == 10:
+        return datetime(int(dt_str[:4]), int(dt_str[5:7]), int(dt_str[8:10]))
+
+    # Python 3.11以降の fromisoformat は末尾の Z も解釈できる
+    return datetime.fromisoformat(dt_str)
+
+
+# parse_page で抽出するプロパティ定義
+# (Notionのプロパティ名, プロパティの型, TrainingProjectの属性名, 変換関数)
+FIELD_SPEC = (
+    ("案件名", "title", "title", None),
+    ("ステータス", "status", "status", None),
+    ("開始", "date", "start_date", parse_datetime),
+    ("終了", "date", "end_date", parse_datetime),
+    ("金額", "number", "amount", None),
+    ("単価", "number", "unit_price", None),
+    ("参加人数", "number", "participants", int),
+    ("日数", "number", "days", int),
+    ("研修場所", "rich_text", "location", None),
+    ("研修形式", "select", "format", None),
+    ("備考", "rich_text", "notes", None),
+    ("請求済み", "checkbox", "invoiced", None),
+)
+
+# プロパティ名 → (型, 属性名, 変換関数)
+_FIELDS_BY_NAME = {key: (prop_type, attr, coerce) for key, prop_type, attr, coerce in FIELD_SPEC}
+
+# プロパティがない場合の各属性の値
+_DEFAULT_FIELDS = MappingProxyType({
+    attr: _MISSING_VALUES.get(prop_type) for _, prop_type, attr, _ in FIELD_SPEC
+})
+
+# parse_page が参照するNotionのプロパティ名（クエリで取得するプロパティの指定に使う）
+PROPERTY_NAMES = tuple(_FIELDS_BY_NAME) + ("顧客名",)
@@ -1,12 +1,16 @@
 """OAuth 2.0認証処理"""
-import json
+import asyncio
+import html
 import webbrowser
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlencode, urlparse, parse_qs
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from .config import config
 from .logger import setup_logger
@@ -14,6 +18,29 @@ from .exceptions import AuthenticationError
 
 logger = setup_logger(__name__)
 
+# OAuthコールバックで返すHTML（エンコード済み）
+_SUCCESS_HTML = """
+<html>
+<head><title>認証完了</title></head>
+<body>
+    <h1>認証が完了しました！</h1>
+    <p>このウィンドウを閉じて、ターミナルに戻ってください。</p>
+</body>
+</html>
+""".encode('utf-8')
+
+# エラー内容は %b に HTMLエスケープ済みのバイト列を埋め込む
+_ERROR_TEMPLATE = """
+<html>
+<head><title>認証エラー</title></head>
+<body>
+    <h1>認証に失敗しました</h1>
+    <p>エラー: %b</p>
+    <p>このウィンドウを閉じて、やり直してください。</p>
+</body>
+</html>
+""".encode('utf-8')
+
 
 class OAuthCallbackHandler(BaseHTTPRequestHandler):
     """OAuthコールバックを処理するHTTPハンドラー"""
@@ -30,48 +57,45 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
         if 'code' in params:
             # 認証コード取得成功
             OAuthCallbackHandler.auth_code = params['code'][0]
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            html = """
-            <html>
-            <head><title>認証完了</title></head>
-            <body>
-                <h1>認証が完了しました！</h1>
-                <p>このウィンドウを閉じて、ターミナルに戻ってください。</p>
-            </body>
-            </html>
-            """
-            self.wfile.write(html.encode('utf-8'))
+            self._send_html(200, _SUCCESS_HTML)
         elif 'error' in params:
             # エラー
             OAuthCallbackHandler.error = params['error'][0]
-            self.send_response(400)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            html = f"""
-            <html>
-            <head><title>認証エラー</title></head>
-            <body>
-                <h1>認証に失敗しました</h1>
-                <p>エラー: {OAuthCallbackHandler.error}</p>
-                <p>このウィンドウを閉じて、やり直してください。</p>
-            </body>
-            </html>
-            """
-            self.wfile.write(html.encode('utf-8'))
+            error = html.escape(OAuthCallbackHandler.error).encode('utf-8')
+            self._send_html(400, _ERROR_TEMPLATE % error)
+
+    def _send_html(self, status: int, body: bytes) -> None:
+        """HTMLレスポンスを送信
+
+        Args:
+            status: HTTPステータスコード
+            body: エンコード済みのHTML
+        """
+        self.send_response(status)
+        self.send_header('Content-type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
     def log_message(self, format, *args):
         """ログメッセージを抑制"""
         pass
 
 
-class MoneyForwardAuth:
-    """MoneyForward OAuth 2.0認証クライアント"""
+class _MoneyForwardAuthBase:
+    """MoneyForward OAuth 2.0認証の共通処理（トークンファイルの管理と有効期限の判定）
+
+    HTTP通信を行うメソッドは同期版・非同期版のサブクラスがそれぞれ実装する
+    """
 
     AUTH_URL = "https://invoice.moneyforward.com/oauth/authorize"
     TOKEN_URL = "https://invoice.moneyforward.com/oauth/token"
     TOKEN_FILE = Path.home() / ".notion-to-mf" / "mf_token.json"
+    # キャッシュしたアクセストークンを使い続ける期限の余裕（有効期限の何秒前まで）
+    TOKEN_CACHE_MARGIN = timedelta(seconds=60)
+    # トークン取得・更新用の接続プール設定
+    POOL_CONNECTIONS = 2
+    POOL_MAXSIZE = 4
 
     def __init__(self):
         """初期化"""
@@ -79,17 +103,23 @@ class MoneyForwardAuth:
         self.client_secret = config.MONEYFORWARD_CLIENT_SECRET
         self.redirect_uri = config.MONEYFORWARD_REDIRECT_URI
 
+        # 読み込み済みトークンのキャッシュ（ファイルの更新時刻で有効性を判定）
+        self._cached_token: Optional[Dict[str, Any]] = None
+        self._cached_token_mtime: Optional[int] = None
+        # 有効確認済みアクセストークン（ファイル更新時刻, アクセストークン, キャッシュ期限）
+        self._token_cache: Optional[Tuple[int, str, datetime]] = None
+
         # トークンファイルのディレクトリを作成
         self.TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    def authenticate(self) -> Dict[str, Any]:
-        """OAuth 2.0認証フローを実行
+    def _wait_for_auth_code(self) -> str:
+        """ブラウザで認可ページを開き、コールバックで認証コードを受け取る
 
         Returns:
-            トークン情報
+            認証コード
 
         Raises:
-            AuthenticationError: 認証に失敗した場合
+            AuthenticationError: 認証コードを取得できなかった場合
         """
         try:
             config.validate_moneyforward()
@@ -124,9 +154,181 @@ class MoneyForwardAuth:
         if not OAuthCallbackHandler.auth_code:
             raise AuthenticationError("認証コードを取得できませんでした")
 
+        return OAuthCallbackHandler.auth_code
+
+    def _authorization_code_data(self, code: str) -> Dict[str, str]:
+        """認証コードをトークンに交換するリクエストのパラメータ"""
+        return {
+            'grant_type': 'authorization_code',
+            'code': code,
+            'redirect_uri': self.redirect_uri,
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+        }
+
+    def _refresh_token_data(self, refresh_token: str) -> Dict[str, str]:
+        """トークンを更新するリクエストのパラメータ"""
+        return {
+            'grant_type': 'refresh_token',
+            'refresh_token': refresh_token,
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+        }
+
+    @staticmethod
+    def _with_expires_at(token_data: Dict[str, Any]) -> Dict[str, Any]:
+        """トークン情報に有効期限（expires_at）を計算して追加"""
+        if 'expires_in' in token_data:
+            expires_at = datetime.now() + timedelta(seconds=token_data['expires_in'])
+            token_data['expires_at'] = expires_at.isoformat()
+        return token_data
+
+    def _cached_access_token(self) -> Optional[str]:
+        """有効期限まで余裕のあるキャッシュ済みアクセストークンを取得
+
+        Returns:
+            アクセストークン（キャッシュが使えない場合はNone）
+        """
+        cached = self._token_cache
+        if cached is not None and datetime.now() < cached[2]:
+            # 外部でトークンファイルが書き換えられていないか確認
+            try:
+                if self.TOKEN_FILE.stat().st_mtime_ns == cached[0]:
+                    return cached[1]
+            except FileNotFoundError:
+                pass
+            self._token_cache = None
+        return None
+
+    @staticmethod
+    def _is_expired(token_data: Dict[str, Any]) -> bool:
+        """トークンが有効期限切れかどうかを判定"""
+        if 'expires_at' not in token_data:
+            return False
+        return datetime.now() >= datetime.fromisoformat(token_data['expires_at'])
+
+    def _remember_access_token(self, token_data: Dict[str, Any]) -> Optional[str]:
+        """有効なトークンのアクセストークンをキャッシュして返す
+
+        Args:
+            token_data: 有効期限を確認済みのトークン情報
+
+        Returns:
+            アクセストークン（ない場合はNone）
+        """
+        access_token = token_data.get('access_token')
+        if access_token and self._cached_token_mtime is not None:
+            if 'expires_at' in token_data:
+                cache_until = datetime.fromisoformat(token_data['expires_at']) - self.TOKEN_CACHE_MARGIN
+            else:
+                cache_until = datetime.max
+            self._token_cache = (self._cached_token_mtime, access_token, cache_until)
+
+        return access_token
+
+    def _save_token(self, token_data: Dict[str, Any]) -> None:
+        """トークンをファイルに保存
+
+        Args:
+            token_data: トークン情報
+        """
+        self._token_cache = None
+        self.TOKEN_FILE.write_bytes(orjson.dumps(token_data, option=orjson.OPT_INDENT_2))
+
+        # ファイルのパーミッションを制限（Unix系のみ）
+        try:
+            self.TOKEN_FILE.chmod(0o600)
+        except Exception:
+            pass  # Windowsでは無視
+
+        # 書き込んだ内容をキャッシュ
+        self._cached_token = token_data
+        self._cached_token_mtime = self.TOKEN_FILE.stat().st_mtime_ns
+
+        logger.debug(f"トークンを保存しました: {self.TOKEN_FILE}")
+
+    def _load_token(self) -> Optional[Dict[str, Any]]:
+        """トークンをファイルから読み込み
+
+        ファイルの更新時刻が前回の読み込み時から変わっていなければキャッシュを返す
+
+        Returns:
+            トークン情報（ない場合はNone）
+        """
+        try:
+            mtime = self.TOKEN_FILE.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._cached_token = None
+            return None
+
+        if self._cached_token is not None and mtime == self._cached_token_mtime:
+            return self._cached_token
+
+        try:
+            token_data = orjson.loads(self.TOKEN_FILE.read_bytes())
+        except Exception as e:
+            logger.warning(f"トークン読み込みエラー: {e}")
+            return None
+
+        self._cached_token = token_data
+        self._cached_token_mtime = mtime
+        return token_data
+
+    def clear_token(self) -> None:
+        """保存されているトークンを削除"""
+        self._cached_token = None
+        self._token_cache = None
+        if self.TOKEN_FILE.exists():
+            self.TOKEN_FILE.unlink()
+            logger.info("トークンを削除しました")
+
+
+class MoneyForwardAuth(_MoneyForwardAuthBase):
+    """MoneyForward OAuth 2.0認証クライアント"""
+
+    def __init__(self):
+        """初期化"""
+        super().__init__()
+        # トークン取得・更新で接続を再利用するHTTPセッション
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """トークン取得・更新用のHTTPセッションを作成
+
+        Returns:
+            HTTPセッション
+        """
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+        ))
+        return session
+
+    def close(self) -> None:
+        """HTTPセッションを閉じる"""
+        self._session.close()
+
+    def __enter__(self) -> "MoneyForwardAuth":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def authenticate(self) -> Dict[str, Any]:
+        """OAuth 2.0認証フローを実行
+
+        Returns:
+            トークン情報
+
+        Raises:
+            AuthenticationError: 認証に失敗した場合
+        """
+        code = self._wait_for_auth_code()
+
         # 認証コードをアクセストークンに交換
         logger.info("アクセストークンを取得中...")
-        token_data = self._exchange_code_for_token(OAuthCallbackHandler.auth_code)
+        token_data = self._exchange_code_for_token(code)
 
         # トークンを保存
         self._save_token(token_data)
@@ -146,25 +348,10 @@ class MoneyForwardAuth:
         Raises:
             AuthenticationError: トークン取得に失敗した場合
         """
-        data = {
-            'grant_type': 'authorization_code',
-            'code': code,
-            'redirect_uri': self.redirect_uri,
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-        }
-
         try:
-            response = requests.post(self.TOKEN_URL, data=data)
+            response = self._session.post(self.TOKEN_URL, data=self._authorization_code_data(code))
             response.raise_for_status()
-            token_data = response.json()
-
-            # 有効期限を計算して追加
-            if 'expires_in' in token_data:
-                expires_at = datetime.now() + timedelta(seconds=token_data['expires_in'])
-                token_data['expires_at'] = expires_at.isoformat()
-
-            return token_data
+            return self._with_expires_at(response.json())
 
         except requests.exceptions.RequestException as e:
             logger.error(f"トークン取得エラー: {e}")
@@ -182,22 +369,10 @@ class MoneyForwardAuth:
         Raises:
             AuthenticationError: トークン更新に失敗した場合
         """
-        data = {
-            'grant_type': 'refresh_token',
-            'refresh_token': refresh_token,
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-        }
-
         try:
-            response = requests.post(self.TOKEN_URL, data=data)
+            response = self._session.post(self.TOKEN_URL, data=self._refresh_token_data(refresh_token))
             response.raise_for_status()
-            token_data = response.json()
-
-            # 有効期限を計算して追加
-            if 'expires_in' in token_data:
-                expires_at = datetime.now() + timedelta(seconds=token_data['expires_in'])
-                token_data['expires_at'] = expires_at.isoformat()
+            token_data = self._with_expires_at(response.json())
 
             # トークンを保存
             self._save_token(token_data)
@@ -212,27 +387,31 @@ class MoneyForwardAuth:
     def get_valid_token(self) -> Optional[str]:
         """有効なアクセストークンを取得
 
+        有効期限まで余裕のあるトークンはメモリ上のキャッシュから返す
+
         Returns:
             アクセストークン（ない場合はNone）
         """
+        access_token = self._cached_access_token()
+        if access_token:
+            return access_token
+
         token_data = self._load_token()
         if not token_data:
             return None
 
         # トークンの有効期限をチェック
-        if 'expires_at' in token_data:
-            expires_at = datetime.fromisoformat(token_data['expires_at'])
-            if datetime.now() >= expires_at:
-                # トークンが期限切れ - リフレッシュを試みる
-                if 'refresh_token' in token_data:
-                    try:
-                        token_data = self.refresh_token(token_data['refresh_token'])
-                    except AuthenticationError:
-                        return None
-                else:
-                    return None
-
-        return token_data.get('access_token')
+        if self._is_expired(token_data):
+            # トークンが期限切れ - リフレッシュを試みる
+            if 'refresh_token' not in token_data:
+                return None
+            try:
+                token_data = self.refresh_token(token_data['refresh_token'])
+            except AuthenticationError:
+                self._token_cache = None
+                return None
+
+        return self._remember_access_token(token_data)
 
     def is_authenticated(self) -> bool:
         """認証済みかどうかを確認
@@ -242,41 +421,177 @@ class MoneyForwardAuth:
         """
         return self.get_valid_token() is not None
 
-    def _save_token(self, token_data: Dict[str, Any]) -> None:
-        """トークンをファイルに保存
 
-        Args:
-            token_data: トークン情報
+class AsyncMoneyForwardAuth(_MoneyForwardAuthBase):
+    """MoneyForward OAuth 2.0認証クライアント（asyncio版）
+
+    MoneyForwardAuth と同じトークンファイルを共有し、トークンの取得・更新を
+    httpx.AsyncClient で行ってイベントループを止めない。
+    トークンファイルの読み書きはスレッドに逃がし、書き込みは asyncio.Lock で直列化する。
+
+    Example:
+        async with AsyncMoneyForwardAuth() as auth:
+            token = await auth.get_valid_token()
+    """
+
+    def __init__(self):
+        """初期化"""
+        super().__init__()
+        # トークン取得・更新で接続を再利用する非同期HTTPクライアント
+        self._session = self._create_session()
+        # トークン更新・保存を直列化するロック
+        self._token_lock = asyncio.Lock()
+
+    def _create_session(self) -> httpx.AsyncClient:
+        """トークン取得・更新用の非同期HTTPクライアントを作成
+
+        Returns:
+            非同期HTTPクライアント
         """
-        with open(self.TOKEN_FILE, 'w') as f:
-            json.dump(token_data, f, indent=2)
+        return httpx.AsyncClient(limits=httpx.Limits(
+            max_connections=self.POOL_MAXSIZE,
+            max_keepalive_connections=self.POOL_CONNECTIONS,
+        ))
 
-        # ファイルのパーミッションを制限（Unix系のみ）
+    async def close(self) -> None:
+        """HTTPクライアントを閉じる"""
+        await self._session.aclose()
+
+    async def __aenter__(self) -> "AsyncMoneyForwardAuth":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def authenticate(self) -> Dict[str, Any]:
+        """OAuth 2.0認証フローを実行
+
+        コールバックの待機はブロッキング処理のためスレッドで実行する
+
+        Returns:
+            トークン情報
+
+        Raises:
+            AuthenticationError: 認証に失敗した場合
+        """
+        code = await asyncio.to_thread(self._wait_for_auth_code)
+
+        # 認証コードをアクセストークンに交換
+        logger.info("アクセストークンを取得中...")
+        token_data = await self._exchange_code_for_token(code)
+
+        # トークンを保存
+        await self._save_token_async(token_data)
+
+        logger.info("認証が完了しました！")
+        return token_data
+
+    async def _exchange_code_for_token(self, code: str) -> Dict[str, Any]:
+        """認証コードをアクセストークンに交換
+
+        Args:
+            code: 認証コード
+
+        Returns:
+            トークン情報
+
+        Raises:
+            AuthenticationError: トークン取得に失敗した場合
+        """
         try:
-            self.TOKEN_FILE.chmod(0o600)
-        except Exception:
-            pass  # Windowsでは無視
+            response = await self._session.post(self.TOKEN_URL, data=self._authorization_code_data(code))
+            response.raise_for_status()
+            return self._with_expires_at(response.json())
 
-        logger.debug(f"トークンを保存しました: {self.TOKEN_FILE}")
+        except httpx.HTTPError as e:
+            logger.error(f"トークン取得エラー: {e}")
+            raise AuthenticationError(f"トークン取得に失敗しました: {e}")
 
-    def _load_token(self) -> Optional[Dict[str, Any]]:
-        """トークンをファイルから読み込み
+    async def refresh_token(self, refresh_token: str) -> Dict[str, Any]:
+        """リフレッシュトークンを使用してアクセストークンを更新
+
+        Args:
+            refresh_token: リフレッシュトークン
 
         Returns:
-            トークン情報（ない場合はNone）
+            新しいトークン情報
+
+        Raises:
+            AuthenticationError: トークン更新に失敗した場合
         """
-        if not self.TOKEN_FILE.exists():
-            return None
+        token_data = await self._request_refresh(refresh_token)
+
+        # トークンを保存
+        await self._save_token_async(token_data)
 
+        logger.info("アクセストークンを更新しました")
+        return token_data
+
+    async def _request_refresh(self, refresh_token: str) -> Dict[str, Any]:
+        """トークン更新リクエストを送信（保存は呼び出し元で行う）
+
+        Raises:
+            AuthenticationError: トークン更新に失敗した場合
+        """
         try:
-            with open(self.TOKEN_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"トークン読み込みエラー: {e}")
-            return None
+            response = await self._session.post(self.TOKEN_URL, data=self._refresh_token_data(refresh_token))
+            response.raise_for_status()
+            return self._with_expires_at(response.json())
 
-    def clear_token(self) -> None:
-        """保存されているトークンを削除"""
-        if self.TOKEN_FILE.exists():
-            self.TOKEN_FILE.unlink()
-            logger.info("トークンを削除しました")
+        except httpx.HTTPError as e:
+            logger.error(f"トークン更新エラー: {e}")
+            raise AuthenticationError(f"トークン更新に失敗しました: {e}")
+
+    async def get_valid_token(self) -> Optional[str]:
+        """有効なアクセストークンを取得
+
+        期限切れの場合の更新はロック内で行い、同時に呼ばれても1回だけ更新する
+
+        Returns:
+            アクセストークン（ない場合はNone）
+        """
+        access_token = self._cached_access_token()
+        if access_token:
+            return access_token
+
+        async with self._token_lock:
+            # ロック待ちの間に他のタスクが更新済みならそれを使う
+            access_token = self._cached_access_token()
+            if access_token:
+                return access_token
+
+            token_data = await asyncio.to_thread(self._load_token)
+            if not token_data:
+                return None
+
+            # トークンの有効期限をチェック
+            if self._is_expired(token_data):
+                # トークンが期限切れ - リフレッシュを試みる
+                if 'refresh_token' not in token_data:
+                    return None
+                try:
+                    token_data = await self._request_refresh(token_data['refresh_token'])
+                except AuthenticationError:
+                    self._token_cache = None
+                    return None
+                await asyncio.to_thread(self._save_token, token_data)
+                logger.info("アクセストークンを更新しました")
+
+            return self._remember_access_token(token_data)
+
+    async def is_authenticated(self) -> bool:
+        """認証済みかどうかを確認
+
+        Returns:
+            認証済みの場合True
+        """
+        return await self.get_valid_token() is not None
+
+    async def _save_token_async(self, token_data: Dict[str, Any]) -> None:
+        """トークンをファイルに保存（書き込みはロック内でスレッド実行）
+
+        Args:
+            token_data: トークン情報
+        """
+        async with self._token_lock:
+            await asyncio.to_thread(self._save_token, token_data)
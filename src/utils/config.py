@@ -3,9 +3,10 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
-# .envファイルを読み込み
+# .envファイルを読み込み（ファイルがない環境では読み込み処理自体を省略）
 env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+if env_path.is_file():
+    load_dotenv(dotenv_path=env_path)
 
 
 class Config:
@@ -14,18 +15,34 @@ class Config:
     # Notion設定
     NOTION_API_KEY = os.getenv('NOTION_API_KEY')
     NOTION_DATABASE_ID = os.getenv('NOTION_DATABASE_ID')
+    NOTION_CUSTOMER_DATABASE_ID = os.getenv('NOTION_CUSTOMER_DATABASE_ID')  # 顧客マスタ（任意）
+    NOTION_RATE_LIMIT = float(os.getenv('NOTION_RATE_LIMIT', '3'))  # 1秒あたりのリクエスト数
 
     # MoneyForward設定
     MONEYFORWARD_CLIENT_ID = os.getenv('MONEYFORWARD_CLIENT_ID')
     MONEYFORWARD_CLIENT_SECRET = os.getenv('MONEYFORWARD_CLIENT_SECRET')
     MONEYFORWARD_REDIRECT_URI = os.getenv('MONEYFORWARD_REDIRECT_URI', 'http://localhost:8080/callback')
+    MONEYFORWARD_CONCURRENCY = int(os.getenv('MONEYFORWARD_CONCURRENCY', '8'))
+    MONEYFORWARD_RATE_LIMIT = float(os.getenv('MONEYFORWARD_RATE_LIMIT', '3'))  # 1秒あたりのリクエスト数
+    MONEYFORWARD_MAX_RETRY_AFTER = float(os.getenv('MONEYFORWARD_MAX_RETRY_AFTER', '60'))  # Retry-After で待機する最大秒数
+    MONEYFORWARD_GZIP_REQUESTS = os.getenv('MONEYFORWARD_GZIP_REQUESTS', 'false').lower() == 'true'  # 大きなリクエストをgzip圧縮
 
     # アプリケーション設定
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
+    # 検証済みフラグ（同一プロセス内での再検証を省略）
+    _validated = False
+    _moneyforward_validated = False
+
     @classmethod
     def validate(cls):
-        """必須設定の検証"""
+        """必須設定の検証
+
+        一度検証に成功した後は、invalidate() が呼ばれるまで再検証しない
+        """
+        if cls._validated:
+            return
+
         errors = []
 
         if not cls.NOTION_API_KEY:
@@ -37,9 +54,17 @@ class Config:
         if errors:
             raise ValueError(f"設定エラー:\n" + "\n".join(f"  - {e}" for e in errors))
 
+        cls._validated = True
+
     @classmethod
     def validate_moneyforward(cls):
-        """MoneyForward設定の検証"""
+        """MoneyForward設定の検証
+
+        一度検証に成功した後は、invalidate() が呼ばれるまで再検証しない
+        """
+        if cls._moneyforward_validated:
+            return
+
         errors = []
 
         if not cls.MONEYFORWARD_CLIENT_ID:
@@ -51,5 +76,13 @@ class Config:
         if errors:
             raise ValueError(f"MoneyForward設定エラー:\n" + "\n".join(f"  - {e}" for e in errors))
 
+        cls._moneyforward_validated = True
+
+    @classmethod
+    def invalidate(cls):
+        """検証結果のキャッシュを破棄（設定値を変更した場合に使用）"""
+        cls._validated = False
+        cls._moneyforward_validated = False
+
 
 config = Config()
@@ -3,10 +3,37 @@ import logging
 import sys
 from .config import config
 
+# ログレベル（設定値の解決はインポート時に1度だけ行う）
+_LOG_LEVEL = getattr(logging, config.LOG_LEVEL.upper(), logging.INFO)
+
+
+def _create_handler() -> logging.Handler:
+    """全ロガーで共有するコンソールハンドラを作成
+
+    Returns:
+        フォーマット設定済みのハンドラ
+    """
+    # 標準出力はJSON/CSVなどのデータ出力に使うため、ログは標準エラー出力に書き出す
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setLevel(_LOG_LEVEL)
+
+    # フォーマット
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    console_handler.setFormatter(formatter)
+    return console_handler
+
+
+_HANDLER = _create_handler()
+
 
 def setup_logger(name: str = __name__) -> logging.Logger:
     """ロガーのセットアップ
 
+    ハンドラはモジュール間で共有し、ロガーごとに生成しない
+
     Args:
         name: ロガー名
 
@@ -19,22 +46,8 @@ def setup_logger(name: str = __name__) -> logging.Logger:
     if logger.handlers:
         return logger
 
-    # ログレベル設定
-    log_level = getattr(logging, config.LOG_LEVEL.upper(), logging.INFO)
-    logger.setLevel(log_level)
-
-    # コンソールハンドラ
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-
-    # フォーマット
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(formatter)
-
-    logger.addHandler(console_handler)
+    logger.setLevel(_LOG_LEVEL)
+    logger.addHandler(_HANDLER)
 
     return logger
 
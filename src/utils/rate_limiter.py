@@ -0,0 +1,30 @@
+"""APIレート制限ユーティリティ"""
+import threading
+import time
+
+
+class RateLimiter:
+    """一定間隔でリクエストを通すレートリミッター（スレッドセーフ）"""
+
+    def __init__(self, rate: float):
+        """初期化
+
+        Args:
+            rate: 1秒あたりの最大リクエスト数（0以下の場合は制限なし）
+        """
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self) -> None:
+        """次のリクエストが許可されるまで待機"""
+        if not self._interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+
+        if wait_time > 0:
+            time.sleep(wait_time)
@@ -0,0 +1,89 @@
+"""テスト共通のフィクスチャ"""
+import pytest
+
+from src.utils.config import Config
+
+
+def make_page(index: int, customer_id: str = "c1") -> dict:
+    """研修案件データベースのページを模したデータを作成"""
+    return {
+        "id": f"page-{index}",
+        "created_time": "2025-01-01T00:00:00.000Z",
+        "last_edited_time": "2025-01-02T03:04:05.000Z",
+        "properties": {
+            "案件名": {"type": "title", "title": [{"plain_text": f"研修{index}"}]},
+            "ステータス": {"type": "status", "status": {"name": "完了"}},
+            "開始": {"type": "date", "date": {"start": "2025-01-10"}},
+            "終了": {"type": "date", "date": {"start": "2025-01-11T10:00:00.000+09:00"}},
+            "顧客名": {"type": "relation", "relation": [{"id": customer_id}]},
+            "金額": {"type": "number", "number": 100000},
+            "単価": {"type": "number", "number": 50000},
+            "参加人数": {"type": "number", "number": 10},
+            "日数": {"type": "number", "number": 2},
+            "研修場所": {"type": "rich_text", "rich_text": [{"plain_text": "東京"}]},
+            "研修形式": {"type": "select", "select": {"name": "オンライン"}},
+            "備考": {"type": "rich_text", "rich_text": []},
+            "請求済み": {"type": "checkbox", "checkbox": False},
+        },
+    }
+
+
+class FakeNotionClient:
+    """notion_client.Client の代わりに使う、メモリ上のページを返すクライアント"""
+
+    # 1回のクエリで返すページ数（ページネーションを通すため小さくする）
+    page_size = 2
+    # データベースのページ
+    rows: list = []
+
+    def __init__(self, *args, **kwargs):
+        self.databases = _FakeDatabases()
+        self.pages = _FakePages()
+
+
+class _FakeDatabases:
+    def retrieve(self, database_id):
+        return {"properties": {}}
+
+    def query(self, database_id, **params):
+        start = int(params.get("start_cursor") or 0)
+        end = start + FakeNotionClient.page_size
+        has_more = end < len(FakeNotionClient.rows)
+        return {
+            "results": FakeNotionClient.rows[start:end],
+            "has_more": has_more,
+            "next_cursor": str(end) if has_more else None,
+        }
+
+
+class _FakePages:
+    def retrieve(self, page_id):
+        return {
+            "id": page_id,
+            "properties": {"名前": {"type": "title", "title": [{"plain_text": f"顧客{page_id}"}]}},
+        }
+
+    def update(self, page_id, properties):
+        return {"id": page_id}
+
+
+@pytest.fixture
+def notion_config(monkeypatch):
+    """Notion接続に必要な設定を仮の値にする"""
+    monkeypatch.setattr(Config, "NOTION_API_KEY", "secret_test")
+    monkeypatch.setattr(Config, "NOTION_DATABASE_ID", "database-id")
+    monkeypatch.setattr(Config, "NOTION_CUSTOMER_DATABASE_ID", None)
+    monkeypatch.setattr(Config, "NOTION_RATE_LIMIT", 0)
+    Config.invalidate()
+    yield
+    Config.invalidate()
+
+
+@pytest.fixture
+def fake_notion(monkeypatch, notion_config):
+    """NotionService が FakeNotionClient を使うようにする"""
+    import src.services.notion as notion_module
+
+    monkeypatch.setattr(notion_module, "Client", FakeNotionClient)
+    monkeypatch.setattr(FakeNotionClient, "rows", [make_page(i) for i in range(3)])
+    return FakeNotionClient
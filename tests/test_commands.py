@@ -0,0 +1,40 @@
+"""CLIコマンドのテスト"""
+import csv
+import io
+import json
+
+from click.testing import CliRunner
+
+from src.cli.commands import cli
+
+
+def test_fetch_json_stdout_is_valid_json(fake_notion):
+    """ページを取得しながら出力しても、標準出力はJSONとして読み込める"""
+    result = CliRunner().invoke(cli, ["fetch", "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    records = json.loads(result.stdout)
+    assert [record["id"] for record in records] == ["page-0", "page-1", "page-2"]
+    assert records[0]["customer_name"] == "顧客c1"
+
+
+def test_fetch_csv_stdout_contains_only_rows(fake_notion):
+    """CSVを標準出力に書き出す場合、メッセージは混ざらない"""
+    result = CliRunner().invoke(cli, ["fetch", "--format", "csv"])
+
+    assert result.exit_code == 0, result.output
+    rows = list(csv.reader(io.StringIO(result.stdout)))
+    assert len(rows) == 4
+    assert "[INFO]" in result.stderr
+
+
+def test_export_rejects_grouped_with_parallel(fake_notion, tmp_path):
+    """--grouped と --parallel の同時指定は無視せずにエラーにする"""
+    output = tmp_path / "invoices.json"
+    result = CliRunner().invoke(
+        cli, ["export", "--grouped", "--parallel", "--output", str(output)]
+    )
+
+    assert result.exit_code == 2
+    assert "--grouped と --parallel は同時に指定できません" in result.stderr
+    assert not output.exists()
@@ -0,0 +1,42 @@
+"""InvoiceMapper・請求書モデルの金額計算のテスト"""
+from datetime import datetime
+from decimal import Decimal
+
+from src.mappers.invoice_mapper import InvoiceMapper
+from src.models.training_project import TrainingProject
+
+
+def _project(index: int, amount: float) -> TrainingProject:
+    return TrainingProject(
+        id=f"page-{index}",
+        title=f"研修{index}",
+        start_date=datetime(2025, 4, 1),
+        end_date=datetime(2025, 4, 2),
+        customer_name="顧客A",
+        amount=amount,
+    )
+
+
+def test_tax_rounds_half_up_on_exact_half_yen():
+    """小計105円・税率10%（税額10.5円）は四捨五入で11円になる"""
+    invoice = InvoiceMapper().map_to_invoice(_project(0, 105))
+
+    assert invoice.subtotal == Decimal("105")
+    assert invoice.tax_amount == Decimal("11")
+    assert invoice.total_amount == Decimal("116")
+
+
+def test_calculate_totals_matches_mapper_totals():
+    """モデルの再計算とマッパーの計算で金額が一致する"""
+    mapper = InvoiceMapper()
+    invoices = [mapper.map_to_invoice(_project(0, 105))]
+    grouped, errors = mapper.map_grouped_invoices(
+        [_project(1, 105), _project(2, 210), _project(3, 0.5)]
+    )
+    assert errors == []
+    invoices.extend(grouped)
+
+    for invoice in invoices:
+        expected = (invoice.subtotal, invoice.tax_amount, invoice.total_amount)
+        invoice.calculate_totals()
+        assert (invoice.subtotal, invoice.tax_amount, invoice.total_amount) == expected
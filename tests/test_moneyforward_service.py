@@ -0,0 +1,106 @@
+"""MoneyForwardService のテスト"""
+from datetime import datetime
+
+import pytest
+
+import src.services.moneyforward as moneyforward
+from src.mappers.invoice_mapper import InvoiceMapper
+from src.models.training_project import TrainingProject
+from src.services.moneyforward import MoneyForwardService
+from src.utils.config import Config
+
+
+class FakeResponse:
+    """requests.Response の代わりに使うレスポンス"""
+
+    def __init__(self, data, status_code=200, headers=None):
+        self._data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+@pytest.fixture
+def service(monkeypatch):
+    mf_service = MoneyForwardService()
+    monkeypatch.setattr(mf_service.auth, "get_valid_token", lambda: "token")
+    yield mf_service
+    mf_service.close()
+
+
+def test_partner_id_is_looked_up_once_per_name(service, monkeypatch):
+    """取引先は名前ごとに1回だけ検索し、見つからなかった結果もキャッシュする"""
+    calls = []
+
+    def get(url, params, headers):
+        calls.append(params["q"])
+        partners = [{"id": "pt-1", "name": "A社"}, {"id": "pt-2", "name": "A社 東京"}]
+        return FakeResponse({"data": partners if params["q"].startswith("A社") else []})
+
+    monkeypatch.setattr(service._session, "get", get)
+
+    assert service._get_partner_id("A社") == "pt-1"
+    assert service._get_partner_id("A社") == "pt-1"
+    assert service._get_partner_id("B社") is None
+    assert service._get_partner_id("B社") is None
+    assert calls == ["A社", "B社"]
+
+
+def _invoice():
+    project = TrainingProject(
+        id="page-1",
+        title="研修",
+        status="完了",
+        amount=100000,
+        start_date=datetime(2025, 1, 10),
+        end_date=datetime(2025, 1, 10),
+        customer_name="A社",
+        created_time=datetime(2025, 1, 1),
+        last_edited_time=datetime(2025, 1, 1),
+    )
+    return InvoiceMapper().map_to_invoice(project)
+
+
+def test_retry_after_is_capped(monkeypatch):
+    """Retry-After が極端に長くても上限までしか待たない"""
+    monkeypatch.setattr(Config, "MONEYFORWARD_MAX_RETRY_AFTER", 5.0)
+
+    assert moneyforward._retry_after_seconds({"Retry-After": "86400"}) == 5.0
+    assert moneyforward._retry_after_seconds({"Retry-After": "2"}) == 2.0
+    assert moneyforward._CappedRetry().get_retry_after(
+        FakeResponse(None, headers={"Retry-After": "86400"})
+    ) == 5.0
+
+
+def test_create_invoice_retries_429_once_with_capped_wait(service, monkeypatch):
+    """429の場合は上限内の時間だけ待って1回だけ再送し、残りリクエスト数を記録する"""
+    monkeypatch.setattr(Config, "MONEYFORWARD_MAX_RETRY_AFTER", 5.0)
+    monkeypatch.setattr(service, "_get_partner_id", lambda name: None)
+    sleeps = []
+    monkeypatch.setattr(moneyforward.time, "sleep", sleeps.append)
+    responses = [
+        FakeResponse({}, status_code=429, headers={"Retry-After": "86400", "X-RateLimit-Remaining": "0"}),
+        FakeResponse({"id": "billing-1"}, headers={"X-RateLimit-Remaining": "7"}),
+    ]
+    monkeypatch.setattr(service._session, "post", lambda url, data, headers: responses.pop(0))
+
+    assert service.create_invoice(_invoice()) == {"id": "billing-1"}
+    assert sleeps == [5.0]
+    assert service._rl_remaining == 7
+
+
+def test_mf_payload_keeps_numeric_unit_price(service, monkeypatch):
+    """APIへ送る明細の単価は従来どおり数値、エクスポートの明細金額はDecimalの文字列表現"""
+    monkeypatch.setattr(service, "_get_partner_id", lambda name: None)
+    invoice = _invoice()
+
+    payload = service._convert_to_mf_format(invoice)
+
+    assert payload["billing"]["items"][0]["unit_price"] == 100000.0
+    assert invoice.to_dict()["items"][0]["unit_price"] == "100000.0"
+    assert invoice.to_dict()["items"][0]["amount"] == "100000.0"
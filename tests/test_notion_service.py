@@ -0,0 +1,72 @@
+"""NotionService・Notionページ解析のテスト"""
+from datetime import datetime, timedelta, timezone
+
+from src.services import notion_parser
+
+# 型が異なるプロパティ・空の値・定義にないプロパティを含む代表的なページ
+PAGE = {
+    "id": "page-1",
+    "created_time": "2025-01-05T09:30:00.000Z",
+    "last_edited_time": "2025-01-06T12:00:00.000Z",
+    "properties": {
+        "案件名": {"type": "title", "title": [{"plain_text": "新人研修"}, {"plain_text": "（春）"}]},
+        "ステータス": {"type": "status", "status": {"name": "完了"}},
+        "開始": {"type": "date", "date": {"start": "2025-04-01"}},
+        "終了": {"type": "date", "date": {"start": "2025-04-02T18:00:00.000+09:00"}},
+        "顧客名": {"type": "relation", "relation": [{"id": "customer-1"}, {"id": "customer-2"}]},
+        "金額": {"type": "number", "number": 300000},
+        "単価": {"type": "formula", "formula": {"type": "number", "number": 150000}},
+        "参加人数": {"type": "number", "number": 12.0},
+        "日数": {"type": "number", "number": None},
+        "研修場所": {"type": "rich_text", "rich_text": [{"plain_text": "東京本社"}]},
+        "研修形式": {"type": "select", "select": None},
+        "請求済み": {"type": "checkbox", "checkbox": True},
+        "担当者": {"type": "people", "people": []},
+    },
+}
+
+
+def test_parse_page_matches_previous_parser_output():
+    """定義表による解析が、書き換え前の解析と同じ結果になる"""
+    project = notion_parser.parse_page(PAGE)
+
+    assert project.model_dump() == {
+        "id": "page-1",
+        "title": "新人研修（春）",
+        "status": "完了",
+        "start_date": datetime(2025, 4, 1),
+        "end_date": datetime(2025, 4, 2, 18, 0, tzinfo=timezone(timedelta(hours=9))),
+        "customer_name": None,
+        "customer_id": "customer-1",
+        "amount": 300000.0,
+        # 数値以外の型（formula）は値を取り出さない
+        "unit_price": None,
+        "participants": 12,
+        "days": None,
+        "location": "東京本社",
+        "format": None,
+        "notes": None,
+        "created_time": datetime(2025, 1, 5, 9, 30, tzinfo=timezone.utc),
+        "last_edited_time": datetime(2025, 1, 6, 12, 0, tzinfo=timezone.utc),
+        "invoiced": True,
+        "order_form_ids": [],
+        "training_record_ids": [],
+    }
+
+
+def test_parse_page_without_properties_uses_defaults():
+    """プロパティがないページは既定値（タイトルは「無題」）になる"""
+    project = notion_parser.parse_page({"id": "page-2", "properties": {}})
+
+    assert project.title == "無題"
+    assert project.amount is None
+    assert project.invoiced is None
+    assert project.customer_id is None
+
+
+def test_extract_page_title_finds_title_by_type():
+    """顧客マスタのページはプロパティ名に関係なくタイトルを取得する"""
+    page = {"properties": {"会社名": {"type": "title", "title": [{"plain_text": "A社"}]}}}
+
+    assert notion_parser.extract_page_title(page) == "A社"
+    assert notion_parser.extract_page_title({"properties": {}}) is None